@@ -30,6 +30,12 @@ class Settings(BaseSettings):
     max_concurrent_requests: int = (
         15  # concurrent requests (optimized: was 10, increased for better throughput)
     )
+    adaptive_concurrency: bool = (
+        False  # adjust concurrency (up to max_concurrent_requests) from latency and failures
+    )
+    adaptive_target_latency: float = (
+        5.0  # seconds; p95 scrape latency above this halves concurrency
+    )
 
     # HTTP Settings
     timeout: int = (
@@ -70,6 +76,10 @@ class Settings(BaseSettings):
     use_cache_on_502: bool = True  # Use cache even for 502 errors (CloudFront problem, not origin)
     fail_on_stale_cache_502: bool = False  # If True: fail on stale cache (>6h). If False: use cache with warning (better than missing entire scrape)
 
+    # Category page cache (conditional GET with ETag / Last-Modified)
+    category_cache_enabled: bool = False
+    category_cache_dir: str = "data/category_cache"
+
     # GitHub Actions
     github_actions: bool = False
 
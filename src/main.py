@@ -7,6 +7,7 @@ import httpx
 
 from src.config.settings import settings
 from src.scrapers.marketplace_scraper import MarketplaceScraper
+from src.utils.http_client import close_shared_client, get_shared_client
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -19,26 +20,27 @@ async def check_robots_txt() -> bool:
         True if allowed, False otherwise
     """
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            response = await client.get(settings.robots_url)
-            if response.status_code == 200:
-                robots_content = response.text.lower()
-                # Check if marketplace is disallowed
-                # Note: robots.txt might disallow specific paths, but not the main marketplace
-                # Check for explicit disallow of /marketplace (not just /marketplace/search)
-                lines = robots_content.split("\n")
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith("disallow:"):
-                        path = line.replace("disallow:", "").strip()
-                        # Check if /marketplace is explicitly disallowed (not just search)
-                        if path == "/marketplace" or path == "/marketplace/":
-                            logger.warning("robots_txt_disallows_marketplace")
-                            return False
-                        # Allow /marketplace/search to be disallowed (it's in documentation)
-
-                logger.info("robots_txt_check_passed")
-                return True
+        # Shared with the scraper, so the connection opened here is reused for scraping
+        client = get_shared_client()
+        response = await client.get(settings.robots_url, timeout=10)
+        if response.status_code == 200:
+            robots_content = response.text.lower()
+            # Check if marketplace is disallowed
+            # Note: robots.txt might disallow specific paths, but not the main marketplace
+            # Check for explicit disallow of /marketplace (not just /marketplace/search)
+            lines = robots_content.split("\n")
+            for line in lines:
+                line = line.strip()
+                if line.startswith("disallow:"):
+                    path = line.replace("disallow:", "").strip()
+                    # Check if /marketplace is explicitly disallowed (not just search)
+                    if path == "/marketplace" or path == "/marketplace/":
+                        logger.warning("robots_txt_disallows_marketplace")
+                        return False
+                    # Allow /marketplace/search to be disallowed (it's in documentation)
+
+            logger.info("robots_txt_check_passed")
+            return True
     except Exception as e:
         logger.warning("robots_txt_check_failed", error=str(e))
         # Continue anyway, but log warning
@@ -52,6 +54,7 @@ async def main():
     # Check robots.txt
     if not await check_robots_txt():
         logger.error("robots_txt_disallows_scraping")
+        await close_shared_client()
         sys.exit(1)
 
     # Parse command line arguments
@@ -99,7 +102,7 @@ async def main():
 
     # Run scraper
     try:
-        async with MarketplaceScraper() as scraper:
+        async with MarketplaceScraper(owns_client=False) as scraper:
             if creators_only:
                 logger.info("scraping_creators_only")
                 stats = await scraper.scrape_creators_only(limit=limit)
@@ -214,6 +217,8 @@ async def main():
             exc_info=True,
         )
         sys.exit(1)
+    finally:
+        await close_shared_client()
 
     logger.info("scraper_finished")
 
@@ -11,6 +11,15 @@ from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Precompiled patterns (compiled once, reused across parses)
+_CATEGORY_SLUG_RE = re.compile(r"/marketplace/category/([^/]+)/?")
+_FRAMER_SUFFIX_RE = re.compile(r"\s*[-|]\s*Framer.*$", re.I)
+_PRODUCT_COUNT_RE = re.compile(r"(\d+)\s*(?:products?|items?)", re.I)
+_PRODUCT_HREF_RE = re.compile(r"/marketplace/(templates|components|vectors|plugins)/")
+_SUBCATEGORY_HREF_RE = re.compile(r"/marketplace/category/[^/]+/")
+_CATEGORY_HREF_RE = re.compile(r"/marketplace/category/")
+_BREADCRUMB_CLASS_RE = re.compile(r"breadcrumb", re.I)
+
 
 class CategoryParser:
     """Parser for category HTML pages."""
@@ -27,7 +36,7 @@ class CategoryParser:
         Returns:
             Category slug or None
         """
-        match = re.search(r"/marketplace/category/([^/]+)/?", url)
+        match = _CATEGORY_SLUG_RE.search(url)
         if match:
             return match.group(1)
         return None
@@ -70,7 +79,7 @@ class CategoryParser:
                 if og_title:
                     name = og_title.get("content", "").strip()
                     # Remove common suffixes
-                    name = re.sub(r"\s*[-|]\s*Framer.*$", "", name, flags=re.IGNORECASE)
+                    name = _FRAMER_SUFFIX_RE.sub("", name)
 
             if not name:
                 # Use slug as fallback, capitalize it
@@ -93,7 +102,7 @@ class CategoryParser:
             product_count = None
             # Look for product count text
             text_content = soup.get_text()
-            count_match = re.search(r"(\d+)\s*(?:products?|items?)", text_content, re.IGNORECASE)
+            count_match = _PRODUCT_COUNT_RE.search(text_content)
             if count_match:
                 try:
                     product_count = int(count_match.group(1))
@@ -119,40 +128,30 @@ class CategoryParser:
             if "plugin" in url_lower or "plugin" in name.lower():
                 product_types.append("plugin")
 
-            # If no types found, try to infer from product cards
+            # Walk all links once: product links (for type inference) and subcategory links
+            found_types = set()
+            subcategories = []
+            for link in soup.find_all("a", href=True):
+                href = link["href"]
+                product_match = _PRODUCT_HREF_RE.search(href)
+                if product_match:
+                    # "templates" -> "template", etc.
+                    found_types.add(product_match.group(1)[:-1])
+                if _SUBCATEGORY_HREF_RE.search(href):
+                    sub_slug = self.extract_category_slug_from_url(href)
+                    if sub_slug and sub_slug != slug:
+                        subcategories.append(sub_slug)
+
+            # If no types found, infer them from product cards
             if not product_types:
-                product_links = soup.find_all(
-                    "a", href=re.compile(r"/marketplace/(templates|components|vectors|plugins)/")
-                )
-                found_types = set()
-                for link in product_links:
-                    href = link.get("href", "")
-                    if "/marketplace/templates/" in href:
-                        found_types.add("template")
-                    elif "/marketplace/components/" in href:
-                        found_types.add("component")
-                    elif "/marketplace/vectors/" in href:
-                        found_types.add("vector")
-                    elif "/marketplace/plugins/" in href:
-                        found_types.add("plugin")
                 product_types = list(found_types)
 
-            # Extract subcategories (if available)
-            subcategories = []
-            # Look for subcategory links
-            subcategory_links = soup.find_all("a", href=re.compile(r"/marketplace/category/[^/]+/"))
-            for link in subcategory_links:
-                href = link.get("href", "")
-                sub_slug = self.extract_category_slug_from_url(href)
-                if sub_slug and sub_slug != slug:
-                    subcategories.append(sub_slug)
-
             # Extract parent category (if available)
             parent_category = None
             # Look for breadcrumbs or parent category links
-            breadcrumbs = soup.find_all(["nav", "ol"], class_=re.compile(r"breadcrumb", re.I))
+            breadcrumbs = soup.find_all(["nav", "ol"], class_=_BREADCRUMB_CLASS_RE)
             for breadcrumb in breadcrumbs:
-                links = breadcrumb.find_all("a", href=re.compile(r"/marketplace/category/"))
+                links = breadcrumb.find_all("a", href=_CATEGORY_HREF_RE)
                 if len(links) > 1:
                     # Last link before current is parent
                     parent_link = links[-2] if len(links) >= 2 else None
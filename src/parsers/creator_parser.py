@@ -4,7 +4,7 @@ import re
 from typing import Optional
 from urllib.parse import unquote
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 
 from src.config.settings import settings
 from src.models.creator import Creator, CreatorStats
@@ -13,6 +13,22 @@ from src.parsers.product_parser import ProductParser
 
 logger = get_logger(__name__)
 
+# Only build the tree for tags the parser reads (name, meta, Next.js JSON, sidebar,
+# avatar, bio, links, product cards); top-level <style>, <link>, <svg> etc. are skipped
+_STRAINER = SoupStrainer(["h1", "meta", "script", "div", "img", "p", "a"])
+
+# Precompiled patterns (compiled once, reused across parses)
+_USERNAME_RE = re.compile(r"/@([^/]+)/?")
+_CREATOR_SUFFIX_RE = re.compile(r"Creator\s*$", re.I)
+_FRAMER_SUFFIX_RE = re.compile(r"\s*[-|]\s*Framer.*$", re.I)
+_AVATAR_JSON_RE = re.compile(r'"avatar"\s*:\s*"(https?://[^"]+)"')
+_SOCIALS_JSON_RE = re.compile(r'"socials"\s*:\s*\[(.*?)\]', re.DOTALL)
+_JSON_URL_RE = re.compile(r'"(https?://[^"]+)"')
+_SRCSET_URL_RE = re.compile(r"url=([^&\s]+)")
+_SIDEBAR_CLASS_RE = re.compile(r"sidebar", re.I)
+_AVATAR_CLASS_RE = re.compile(r"avatar", re.I)
+_PRODUCT_HREF_RE = re.compile(r"/marketplace/(templates|components|vectors|plugins)/")
+
 
 class CreatorParser:
     """Parser for creator profile HTML pages."""
@@ -33,7 +49,7 @@ class CreatorParser:
             Username (without @) or None
         """
         # Match /@username/ or https://www.framer.com/@username/
-        match = re.search(r"/@([^/]+)/?", url)
+        match = _USERNAME_RE.search(url)
         if match:
             return match.group(1)
         return None
@@ -49,7 +65,7 @@ class CreatorParser:
             Creator model or None if parsing failed
         """
         try:
-            soup = BeautifulSoup(html, "lxml")
+            soup = BeautifulSoup(html, "lxml", parse_only=_STRAINER)
 
             # Extract username from URL
             username = self.extract_username_from_url(url)
@@ -70,7 +86,7 @@ class CreatorParser:
             if h1:
                 name = h1.get_text().strip()
                 # Remove "Creator" suffix if present (with or without space before it)
-                name = re.sub(r"Creator\s*$", "", name, flags=re.IGNORECASE)
+                name = _CREATOR_SUFFIX_RE.sub("", name)
 
             if not name:
                 # Try meta og:title
@@ -78,9 +94,9 @@ class CreatorParser:
                 if og_title:
                     name = og_title.get("content", "").strip()
                     # Remove common suffixes
-                    name = re.sub(r"\s*[-|]\s*Framer.*$", "", name, flags=re.IGNORECASE)
+                    name = _FRAMER_SUFFIX_RE.sub("", name)
                     # Remove "Creator" suffix if present (with or without space before it)
-                    name = re.sub(r"Creator\s*$", "", name, flags=re.IGNORECASE)
+                    name = _CREATOR_SUFFIX_RE.sub("", name)
 
             # Extract avatar - prioritize JSON data, then HTML images
             avatar_url = None
@@ -98,9 +114,7 @@ class CreatorParser:
                     try:
                         # Try to find the avatar URL in the creator object
                         # Look for "avatar":"https://..." pattern
-                        avatar_match = re.search(
-                            r'"avatar"\s*:\s*"(https?://[^"]+)"', script_content
-                        )
+                        avatar_match = _AVATAR_JSON_RE.search(script_content)
                         if avatar_match:
                             potential_url = avatar_match.group(1)
                             # Check if it's not a placeholder API URL
@@ -113,9 +127,9 @@ class CreatorParser:
             # If not found in JSON, try to find avatar image in sidebar
             if not avatar_url:
                 # Look for avatar in sidebar (most reliable location)
-                sidebar = soup.find("div", class_=re.compile(r"sidebar", re.I))
+                sidebar = soup.find("div", class_=_SIDEBAR_CLASS_RE)
                 if sidebar:
-                    avatar_container = sidebar.find("div", class_=re.compile(r"avatar", re.I))
+                    avatar_container = sidebar.find("div", class_=_AVATAR_CLASS_RE)
                     if avatar_container:
                         img = avatar_container.find("img")
                         if img:
@@ -123,7 +137,7 @@ class CreatorParser:
                             srcset = img.get("srcSet") or img.get("srcset")
                             if srcset:
                                 # Extract first URL from srcSet
-                                srcset_urls = re.findall(r"url=([^&\s]+)", srcset)
+                                srcset_urls = _SRCSET_URL_RE.findall(srcset)
                                 if srcset_urls:
                                     avatar_url = self._product_parser.decode_nextjs_image_url(
                                         unquote(srcset_urls[0])
@@ -146,7 +160,13 @@ class CreatorParser:
 
             # Final fallback: look for any img with alt containing username
             if not avatar_url:
-                img = soup.find("img", alt=re.compile(r"avatar|profile|%s" % username, re.I))
+                # Plain case-insensitive substring test, no per-creator regex
+                alt_terms = ("avatar", "profile", username.lower())
+
+                def is_avatar_alt(alt: Optional[str]) -> bool:
+                    return alt is not None and any(term in alt.lower() for term in alt_terms)
+
+                img = soup.find("img", alt=is_avatar_alt)
                 if img:
                     avatar_src = img.get("src") or img.get("data-src")
                     if avatar_src:
@@ -181,7 +201,6 @@ class CreatorParser:
             links = soup.find_all("a", href=True)
             for link in links:
                 href = link.get("href", "")
-                text = link.get_text().strip()
                 # Check if it's an external website link
                 if href.startswith("http") and not href.startswith(settings.base_url):
                     # Check if it's not a social media link
@@ -208,13 +227,11 @@ class CreatorParser:
                     try:
                         # Try to find socials array in creator object
                         # Pattern: "socials":["url1","url2",...]
-                        socials_match = re.search(
-                            r'"socials"\s*:\s*\[(.*?)\]', script_content, re.DOTALL
-                        )
+                        socials_match = _SOCIALS_JSON_RE.search(script_content)
                         if socials_match:
                             socials_content = socials_match.group(1)
                             # Extract URLs from the array (handle both string and object formats)
-                            urls = re.findall(r'"(https?://[^"]+)"', socials_content)
+                            urls = _JSON_URL_RE.findall(socials_content)
                             for url in urls:
                                 url_lower = url.lower()
                                 # Skip if it's Framer's own social links
@@ -250,7 +267,7 @@ class CreatorParser:
             # Fallback: try to find social media links in HTML (only if not already found)
             if not social_media:
                 # Look for links in sidebar section (not in footer)
-                sidebar = soup.find("div", class_=re.compile(r"sidebar", re.I))
+                sidebar = soup.find("div", class_=_SIDEBAR_CLASS_RE)
                 sidebar_links = sidebar.find_all("a", href=True) if sidebar else []
 
                 # Only check links that are NOT in footer (to avoid Framer's own social links)
@@ -341,20 +358,11 @@ class CreatorParser:
         # Count products by type
         for card in product_cards:
             # Try to find link to product
-            link = card.find(
-                "a", href=re.compile(r"/marketplace/(templates|components|vectors|plugins)/")
-            )
+            link = card.find("a", href=_PRODUCT_HREF_RE)
             if link:
-                href = link.get("href", "")
-                # Determine product type from URL
-                if "/marketplace/templates/" in href:
-                    stats_dict["templates_count"] += 1
-                elif "/marketplace/components/" in href:
-                    stats_dict["components_count"] += 1
-                elif "/marketplace/vectors/" in href:
-                    stats_dict["vectors_count"] += 1
-                elif "/marketplace/plugins/" in href:
-                    stats_dict["plugins_count"] += 1
+                # Product type comes straight from the URL segment ("templates" -> templates_count)
+                type_match = _PRODUCT_HREF_RE.search(link.get("href", ""))
+                stats_dict[f"{type_match.group(1)}_count"] += 1
 
         # Calculate total
         stats_dict["total_products"] = (
@@ -364,11 +372,4 @@ class CreatorParser:
             + stats_dict["plugins_count"]
         )
 
-        # Try to find "See All" link to determine if there are more products
-        see_all_link = soup.find("a", string=re.compile(r"See All|View All", re.I))
-        if see_all_link:
-            # If "See All" exists, there might be more products than visible
-            # We can't determine exact count, but we know there are at least the visible ones
-            pass
-
         return CreatorStats(**stats_dict)
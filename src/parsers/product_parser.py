@@ -1,24 +1,100 @@
 """Product parser for extracting data from product HTML pages."""
 
+import html as html_lib
 import re
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse, parse_qs, unquote
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
 from src.config.settings import settings
+from src.models.creator import Creator
 from src.models.product import (
     Product,
     ProductStats,
     ProductMetadata,
     NormalizedDate,
     NormalizedStatistic,
+    ProductFeatures,
 )
 from src.utils.logger import get_logger
 from src.utils.normalizers import parse_relative_date, parse_statistic
 
 logger = get_logger(__name__)
 
+# Skip the <head> tags the parser never reads (<style>, <link>, preloads, ...). A matched tag
+# keeps its whole subtree, while text outside every matched tag is dropped, so <body> is kept
+# whole: the stats/price/metadata regexes run over all of its text (get_text() parity).
+# <script> in <head> stays in for the component installs JSON.
+_STRAINER = SoupStrainer(["title", "meta", "script", "body"])
+
+# Precompiled patterns for section lookups (compiled once, reused across parses)
+_FEATURES_TEXT_RE = re.compile(r"^Features$", re.I)
+_PAGES_TEXT_RE = re.compile(r"^Pages$", re.I)
+_CATEGORIES_TEXT_RE = re.compile(r"^Categories$", re.I)
+_FEATURES_ABOUT_RE = re.compile(r"Features|About", re.I)
+_PRICE_BUTTON_RE = re.compile(r"(Purchase|Preview|Open|Copy)", re.I)
+_FREE_BUTTON_RE = re.compile(r"preview|open in framer|copy component|copy vectors", re.I)
+_LABEL_CLASS_RE = re.compile(r"text-label|contentSidebarItem")
+_CATEGORY_HREF_RE = re.compile(r"/category/|/marketplace/category/")
+_PAGES_COUNT_RE = re.compile(r"(\d+)\s*Pages", re.I)
+# Feature flags inferred from (lowercased) page text
+_RESPONSIVE_RE = re.compile(r"responsive|mobile")
+_ANIMATIONS_RE = re.compile(r"animation|animate|effects")
+_CMS_RE = re.compile(r"cms|contentful|prismic")
+
+# Price fallback selectors: class-name variants are combined so soupsieve walks the tree once
+_PRICE_CLASS_SELECTOR = '[class*="price"], [class*="Price"]'
+_PRICE_META_SELECTOR = 'span[class*="normalMeta"]'
+
+# Stored image limits; screenshots are the leading gallery images
+_GALLERY_LIMIT = 20
+_SCREENSHOTS_LIMIT = 10
+
+# Single pass over page text for every statistic type; the named group tells which one matched
+_STATS_RE = re.compile(
+    r"(?P<pages>\d+)\s*Pages|"
+    r"(?P<views>[\d.,]+[Kk]?)\s*Views|"
+    r"(?P<users>[\d.,]+[Kk]?)\s*Users|"
+    r"(?P<installs>[\d.,]+[Kk]?)\s*Installs|"
+    r"(?P<vectors>[\d.,]+)\s*Vectors",
+    re.I,
+)
+# Statistics shown on the product page for each product type
+_STATS_BY_TYPE = {
+    "template": frozenset({"pages", "views"}),
+    "plugin": frozenset({"users"}),  # Version is stored in metadata, not stats
+    "component": frozenset({"installs"}),
+    "vector": frozenset({"users", "views", "vectors"}),
+}
+
+# Raw-HTML scan for the meta tags the parser reads, so they are found without tree lookups.
+# Tags are matched quote-aware (a ">" may appear in a quoted value); comments and script/style
+# bodies are consumed by their own alternatives so <meta> strings inside them are not read.
+_TAG_BODY = r"""(?:[^>"']|"[^"]*"|'[^']*')*"""
+_META_SCAN_RE = re.compile(
+    r"<!--.*?-->"
+    rf"|<script\b{_TAG_BODY}>.*?</script\s*>"
+    rf"|<style\b{_TAG_BODY}>.*?</style\s*>"
+    rf"|(?P<meta><meta\b{_TAG_BODY}>)",
+    re.I | re.S,
+)
+_META_ATTR_RE = re.compile(r"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'=<>`]+))""")
+_META_KEYS = frozenset({"og:title", "og:image", "og:description", "description"})
+
+# Section headings located in a single pass over the document's headings
+_SECTION_HEADING_TAGS = ["h2", "h3", "h4", "h6"]
+_SECTION_HEADINGS = frozenset({"features", "pages", "categories"})
+
+# Lowercased labels that mark navigation/section headers rather than real items
+_NAV_SKIP = frozenset({"see all", "more from", "related"})
+_PAGES_SKIP = _NAV_SKIP | {"pages"}
+_CATEGORIES_SKIP = _NAV_SKIP | {"categories"}
+_CATEGORY_LINK_SKIP = frozenset({"see all", "categories"})
+# Feature tags are skipped when they merely contain one of these labels
+_FEATURE_SKIP_RE = re.compile(r"see all|more from|related|categories|pages|support")
+
 
 class ProductParser:
     """Parser for product HTML pages."""
@@ -90,6 +166,55 @@ class ProductParser:
             return match.group(1)
         return None
 
+    def _extract_meta_tags(self, html: str) -> Dict[str, str]:
+        """Extract og:title, og:image, og:description and description meta content.
+
+        Args:
+            html: Raw HTML content
+
+        Returns:
+            Dict mapping meta property/name to its unescaped content (first occurrence wins)
+        """
+        meta: Dict[str, str] = {}
+        for tag_match in _META_SCAN_RE.finditer(html):
+            tag = tag_match.group("meta")
+            if tag is None:
+                # Comment or script/style body
+                continue
+            attrs = {
+                attr.lower(): double or single or unquoted
+                for attr, double, single, unquoted in _META_ATTR_RE.findall(tag)
+            }
+            for key in (attrs.get("property"), attrs.get("name")):
+                if key in _META_KEYS and key not in meta:
+                    meta[key] = html_lib.unescape(attrs.get("content", ""))
+            if len(meta) == len(_META_KEYS):
+                break
+        return meta
+
+    def parse_many(
+        self,
+        jobs: List[Tuple[str, str, Optional[str]]],
+        max_workers: Optional[int] = None,
+    ) -> List[Optional[Product]]:
+        """Parse many product pages in parallel worker processes.
+
+        Parsing is CPU-bound (tree building and regex scans), so a process pool lets
+        it use every core instead of running behind the GIL.
+
+        Args:
+            jobs: List of (html, url, product_type) tuples, as accepted by parse()
+            max_workers: Number of worker processes (None = CPU count)
+
+        Returns:
+            Parsed products (or None for failed parses) in the same order as jobs
+        """
+        if len(jobs) <= 1:
+            return [self.parse(html, url, product_type) for html, url, product_type in jobs]
+
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+            return list(executor.map(_parse_worker, jobs))
+
     def parse(self, html: str, url: str, product_type: Optional[str] = None) -> Optional[Product]:
         """Parse product HTML and extract data.
 
@@ -102,7 +227,7 @@ class ProductParser:
             Product model or None if parsing failed
         """
         try:
-            soup = BeautifulSoup(html, "lxml")
+            soup = BeautifulSoup(html, "lxml", parse_only=_STRAINER)
 
             # Extract product ID from URL
             parsed_url = urlparse(url)
@@ -121,6 +246,9 @@ class ProductParser:
                 elif "/marketplace/plugins/" in url_lower:
                     product_type = "plugin"
 
+            # Read og:* and description meta tags straight from the raw HTML
+            meta = self._extract_meta_tags(html)
+
             # Extract name and creator from title tag
             title_tag = soup.find("title")
             title_full = None
@@ -128,10 +256,8 @@ class ProductParser:
                 title_full = title_tag.get_text().strip()
 
             # Try meta og:title if title tag not found
-            if not title_full:
-                og_title = soup.find("meta", property="og:title")
-                if og_title:
-                    title_full = og_title.get("content", "").strip()
+            if not title_full and "og:title" in meta:
+                title_full = meta["og:title"].strip()
 
             # Parse title to extract product name and creator name
             name, creator_name_from_title = self._parse_title_components(title_full)
@@ -150,16 +276,11 @@ class ProductParser:
             price = None
             is_free = False
             # Try button text (more reliable for product pages)
-            price_button = soup.find(
-                "button", string=re.compile(r"(Purchase|Preview|Open|Copy)", re.I)
-            )
+            price_button = soup.find("button", string=_PRICE_BUTTON_RE)
             if price_button:
                 button_text = price_button.get_text().strip()
                 # Check for free indicators
-                if any(
-                    free in button_text.lower()
-                    for free in ["preview", "open in framer", "copy component", "copy vectors"]
-                ):
+                if _FREE_BUTTON_RE.search(button_text):
                     is_free = True
                     price = None
                 else:
@@ -173,14 +294,9 @@ class ProductParser:
             if price is None and not is_free:
                 price_elem = soup.select_one('span:contains("$"), span:contains("Free")')
                 if not price_elem:
-                    for selector in [
-                        '[class*="price"]',
-                        '[class*="Price"]',
-                        'span[class*="normalMeta"]',
-                    ]:
-                        price_elem = soup.select_one(selector)
-                        if price_elem:
-                            break
+                    price_elem = soup.select_one(_PRICE_CLASS_SELECTOR) or soup.select_one(
+                        _PRICE_META_SELECTOR
+                    )
 
                 if price_elem:
                     price_text = price_elem.get_text().strip()
@@ -189,25 +305,20 @@ class ProductParser:
             # Extract description
             description = None
             # Try meta description
-            meta_desc = soup.find("meta", attrs={"name": "description"})
-            if meta_desc:
-                description = meta_desc.get("content", "").strip()
+            if "description" in meta:
+                description = meta["description"].strip()
 
             # Try og:description
-            if not description:
-                og_desc = soup.find("meta", property="og:description")
-                if og_desc:
-                    description = og_desc.get("content", "").strip()
+            if not description and "og:description" in meta:
+                description = meta["og:description"].strip()
 
             # Extract images
             thumbnail = None
-            screenshots = []
             gallery = []
 
             # Try og:image for thumbnail
-            og_image = soup.find("meta", property="og:image")
-            if og_image:
-                thumbnail_url = og_image.get("content", "")
+            if "og:image" in meta:
+                thumbnail_url = meta["og:image"]
                 if thumbnail_url:
                     thumbnail_url = self.decode_nextjs_image_url(thumbnail_url)
                     thumbnail = thumbnail_url
@@ -227,14 +338,13 @@ class ProductParser:
                 decoded_src = self.decode_nextjs_image_url(src)
                 if decoded_src not in gallery:
                     gallery.append(decoded_src)
+                    if len(gallery) >= _GALLERY_LIMIT:
+                        break
 
             # Use first gallery image as thumbnail if not found
             if not thumbnail and gallery:
                 thumbnail = gallery[0]
 
-            # Screenshots are typically gallery images
-            screenshots = gallery.copy()
-
             # Extract creator link
             creator_username = None
             creator_url = None
@@ -277,30 +387,42 @@ class ProductParser:
                 if not creator_avatar_url:
                     # Look for images with alt/aria-label containing username
                     if creator_username:
-                        avatar_imgs = soup.find_all("img", alt=re.compile(creator_username, re.I))
+                        # Plain case-insensitive substring test, no per-creator regex
+                        username_lower = creator_username.lower()
+
+                        def has_username(value: Optional[str]) -> bool:
+                            return value is not None and username_lower in value.lower()
+
+                        avatar_imgs = soup.find_all("img", alt=has_username, limit=1)
                         if not avatar_imgs:
                             avatar_imgs = soup.find_all(
-                                "img", attrs={"aria-label": re.compile(creator_username, re.I)}
+                                "img", attrs={"aria-label": has_username}, limit=1
                             )
                         if avatar_imgs:
                             avatar_src = avatar_imgs[0].get("src") or avatar_imgs[0].get("data-src")
                             if avatar_src:
                                 creator_avatar_url = self.decode_nextjs_image_url(avatar_src)
 
+            # Locate Features/Pages/Categories headings once for the section extractors
+            headings = self._index_section_headings(soup)
+
             # Extract categories (all of them)
-            categories = self._extract_categories(soup)
+            categories = self._extract_categories(soup, headings)
             category = (
                 categories[0] if categories else None
             )  # Main category for backward compatibility
 
+            # Materialize page text once and share it between extractors
+            text_content = soup.get_text()
+
             # Extract statistics based on product type
-            stats = self._extract_statistics(soup, product_type)
+            stats = self._extract_statistics(soup, product_type, text_content)
 
             # Extract metadata (dates, version)
-            metadata = self._extract_metadata(soup, product_type)
+            metadata = self._extract_metadata(soup, product_type, text_content)
 
             # Extract features based on product type
-            features = self._extract_features(soup, product_type)
+            features = self._extract_features(soup, product_type, text_content.lower(), headings)
 
             # Create Product model
             product = Product(
@@ -318,16 +440,15 @@ class ProductParser:
                 features=features,
                 media={
                     "thumbnail": thumbnail,
-                    "screenshots": screenshots[:10],  # Limit screenshots
-                    "gallery": gallery[:20],  # Limit gallery
+                    # Screenshots are typically gallery images
+                    "screenshots": gallery[:_SCREENSHOTS_LIMIT],
+                    "gallery": gallery,
                     "video_preview": None,  # TODO: Extract video if available
                 },
             )
 
             # Add creator info if available
             if creator_username and creator_url:
-                from src.models.creator import Creator
-
                 product.creator = Creator(
                     username=creator_username,
                     name=creator_name,  # Use name from title or link text
@@ -347,45 +468,35 @@ class ProductParser:
             )
             return None
 
-    def _extract_statistics(self, soup: BeautifulSoup, product_type: str) -> ProductStats:
+    def _extract_statistics(
+        self, soup: BeautifulSoup, product_type: str, text_content: str
+    ) -> ProductStats:
         """Extract statistics based on product type.
 
         Args:
             soup: BeautifulSoup object
             product_type: Product type (template/component/vector/plugin)
+            text_content: Full page text (soup.get_text())
 
         Returns:
             ProductStats model
         """
         stats_dict = {}
+        wanted = _STATS_BY_TYPE.get(product_type, frozenset())
 
-        # Find all text that might contain statistics
         # Look for patterns like "X Pages", "X Views", "X Users", "X Installs", "X Vectors"
-        text_content = soup.get_text()
-
-        # Templates: Pages + Views
-        if product_type == "template":
-            pages_match = re.search(r"(\d+)\s*Pages", text_content, re.IGNORECASE)
-            if pages_match:
-                pages_raw = pages_match.group(0)
-                stats_dict["pages"] = NormalizedStatistic(**parse_statistic(pages_raw))
-
-            views_match = re.search(r"([\d.,]+[Kk]?)\s*Views", text_content, re.IGNORECASE)
-            if views_match:
-                views_raw = views_match.group(0)
-                stats_dict["views"] = NormalizedStatistic(**parse_statistic(views_raw))
-
-        # Plugins: Version + Users
-        elif product_type == "plugin":
-            # Version is stored in metadata, not stats (extracted in _extract_metadata)
-
-            users_match = re.search(r"([\d.,]+[Kk]?)\s*Users", text_content, re.IGNORECASE)
-            if users_match:
-                users_raw = users_match.group(0)
-                stats_dict["users"] = NormalizedStatistic(**parse_statistic(users_raw))
+        # in the page text with one scan, keeping the first match of each wanted statistic
+        # (templates: pages + views, plugins: users, components: installs,
+        # vectors: users + views + vectors)
+        text_stats: dict[str, str] = {}
+        for match in _STATS_RE.finditer(text_content):
+            name = match.lastgroup
+            if name in wanted and name not in text_stats:
+                text_stats[name] = match.group(0)
+                if len(text_stats) == len(wanted):
+                    break
 
-        # Components: Installs
-        elif product_type == "component":
+        if product_type == "component":
             # First, try to extract from JSON data in script tags (Next.js data)
             # JSON format: "installs":"3.5K" or "installs":123
             installs_raw = None
@@ -424,15 +535,10 @@ class ProductParser:
                 if installs_raw:
                     break
 
-            # If not found in JSON, try to extract from HTML text
+            # If not found in JSON, fall back to the HTML text
             # HTML format: "3.5K Installs" or "3.5KInstalls" (may be without space)
             if not installs_raw:
-                # Pattern with optional space between number and "Installs"
-                installs_match = re.search(
-                    r"([\d.,]+[Kk]?)\s*?Installs", text_content, re.IGNORECASE
-                )
-                if installs_match:
-                    installs_raw = installs_match.group(0)
+                installs_raw = text_stats.get("installs")
 
             # Also try to extract from details section directly
             if not installs_raw:
@@ -454,32 +560,21 @@ class ProductParser:
             # If found, parse and add to stats
             if installs_raw:
                 stats_dict["installs"] = NormalizedStatistic(**parse_statistic(installs_raw))
-
-        # Vectors: Users + Views + Vectors (count)
-        elif product_type == "vector":
-            users_match = re.search(r"([\d.,]+[Kk]?)\s*Users", text_content, re.IGNORECASE)
-            if users_match:
-                users_raw = users_match.group(0)
-                stats_dict["users"] = NormalizedStatistic(**parse_statistic(users_raw))
-
-            views_match = re.search(r"([\d.,]+[Kk]?)\s*Views", text_content, re.IGNORECASE)
-            if views_match:
-                views_raw = views_match.group(0)
-                stats_dict["views"] = NormalizedStatistic(**parse_statistic(views_raw))
-
-            vectors_match = re.search(r"([\d.,]+)\s*Vectors", text_content, re.IGNORECASE)
-            if vectors_match:
-                vectors_raw = vectors_match.group(0)
-                stats_dict["vectors"] = NormalizedStatistic(**parse_statistic(vectors_raw))
+        else:
+            for name, raw in text_stats.items():
+                stats_dict[name] = NormalizedStatistic(**parse_statistic(raw))
 
         return ProductStats(**stats_dict)
 
-    def _extract_metadata(self, soup: BeautifulSoup, product_type: str) -> ProductMetadata:
+    def _extract_metadata(
+        self, soup: BeautifulSoup, product_type: str, text_content: str
+    ) -> ProductMetadata:
         """Extract metadata (dates, version) based on product type.
 
         Args:
             soup: BeautifulSoup object
             product_type: Product type (template/component/vector/plugin)
+            text_content: Full page text (soup.get_text())
 
         Returns:
             ProductMetadata model
@@ -487,7 +582,6 @@ class ProductParser:
         metadata_dict = {}
 
         # Extract published date ("X months ago", "Xmo ago", "Xw ago")
-        text_content = soup.get_text()
         date_patterns = [
             r"(\d+\s*months?\s*ago)",
             r"(\d+mo\s*ago)",
@@ -524,43 +618,72 @@ class ProductParser:
 
         return ProductMetadata(**metadata_dict)
 
-    def _extract_features(self, soup: BeautifulSoup, product_type: str):
+    def _index_section_headings(self, soup: BeautifulSoup) -> Dict[str, List[Tag]]:
+        """Collect section headings (Features, Pages, Categories) in one document pass.
+
+        Args:
+            soup: BeautifulSoup object
+
+        Returns:
+            Dict mapping lowercased heading text to matching headings in document order
+        """
+        headings: Dict[str, List[Tag]] = {}
+        for heading in soup.find_all(_SECTION_HEADING_TAGS):
+            heading_text = heading.get_text().strip().lower()
+            if heading_text in _SECTION_HEADINGS:
+                headings.setdefault(heading_text, []).append(heading)
+        return headings
+
+    @staticmethod
+    def _first_heading(
+        headings: Dict[str, List[Tag]], label: str, tag_names: tuple[str, ...]
+    ) -> Optional[Tag]:
+        """Return the first indexed heading with the given label and tag name."""
+        for heading in headings.get(label, ()):
+            if heading.name in tag_names:
+                return heading
+        return None
+
+    def _extract_features(
+        self,
+        soup: BeautifulSoup,
+        product_type: str,
+        text_lower: str,
+        headings: Dict[str, List[Tag]],
+    ) -> ProductFeatures:
         """Extract features based on product type.
 
         Args:
             soup: BeautifulSoup object
             product_type: Product type (template/component/vector/plugin)
+            text_lower: Lowercased page text (soup.get_text().lower())
+            headings: Section headings from _index_section_headings
 
         Returns:
             ProductFeatures model
         """
-        from src.models.product import ProductFeatures
-
         features_list = []
         pages_count = None
         pages_list = []
 
+        # Plugins and vectors have no Features section; only flags inferred from text apply
+
         # Templates: Features, Pages, "What's Included", "What makes different"
         if product_type == "template":
-            # Find Features section - look for h2/h3 heading with "Features"
-            features_section = None
-            # Try h2 first
-            for heading in soup.find_all(["h2", "h3", "h4"]):
-                if heading.get_text().strip().lower() == "features":
-                    features_section = heading
-                    break
+            # Find Features section - look for h2/h3/h4 heading with "Features"
+            features_section = self._first_heading(headings, "features", ("h2", "h3", "h4"))
 
             # If not found, try finding by text
             if not features_section:
-                features_section = soup.find(string=re.compile(r"^Features$", re.I))
+                features_section = soup.find(string=_FEATURES_TEXT_RE)
                 if features_section:
                     features_section = features_section.find_parent()
 
             if features_section:
                 # Find parent container (usually a section or div after heading)
-                features_parent = features_section.find_next_sibling()
-                if not features_parent:
-                    features_parent = features_section.find_parent()
+                features_parent = (
+                    features_section.find_next_sibling() or features_section.find_parent()
+                )
 
                 if features_parent:
                     # Find all feature links/spans - they're usually in links with class "contentSidebarItem"
@@ -568,87 +691,64 @@ class ProductParser:
                     feature_tags = features_parent.find_all(["a", "span", "div", "li"])
                     for tag in feature_tags:
                         text = tag.get_text().strip()
-                        # Filter: feature tags are usually short, not empty, and not "Features"
-                        if text and len(text) < 100 and text.lower() != "features":
-                            # Skip if it's a navigation link or section header
-                            if not any(
-                                skip in text.lower()
-                                for skip in [
-                                    "see all",
-                                    "more from",
-                                    "related",
-                                    "categories",
-                                    "pages",
-                                    "support",
-                                ]
-                            ):
-                                if text not in features_list:
-                                    features_list.append(text)
+                        # Filter: feature tags are usually short and not empty
+                        if not text or len(text) >= 100:
+                            continue
+                        # Skip the "Features" label itself and navigation/section headers
+                        tag_text_lower = text.lower()
+                        if tag_text_lower == "features" or _FEATURE_SKIP_RE.search(tag_text_lower):
+                            continue
+                        if text not in features_list:
+                            features_list.append(text)
 
             # Extract pages count
-            pages_match = re.search(r"(\d+)\s*Pages", soup.get_text(), re.IGNORECASE)
+            pages_match = _PAGES_COUNT_RE.search(text_lower)
             if pages_match:
                 pages_count = int(pages_match.group(1))
 
             # Extract pages list (if available)
             # Method 1: Look for "Pages" heading (h6, h2, h3, etc.) and find sibling elements
-            pages_heading = None
-            for heading in soup.find_all(["h6", "h2", "h3", "h4"]):
-                heading_text = heading.get_text().strip()
-                if heading_text.lower() == "pages":
-                    pages_heading = heading
-                    break
+            pages_heading = self._first_heading(headings, "pages", ("h6", "h2", "h3", "h4"))
 
             if pages_heading:
                 # Find parent section that contains the heading
                 section = pages_heading.find_parent(["section", "div"])
                 if section:
                     # Find all links/spans/divs in the section (pages are usually in links or spans)
-                    page_elements = section.find_all(
-                        ["a", "span", "div"], class_=re.compile(r"text-label|contentSidebarItem")
-                    )
+                    page_elements = section.find_all(["a", "span", "div"], class_=_LABEL_CLASS_RE)
                     for elem in page_elements:
                         page_text = elem.get_text().strip()
-                        if page_text and len(page_text) < 100:
-                            # Skip if it's just "Pages" label or navigation
-                            if page_text.lower() not in [
-                                "pages",
-                                "see all",
-                                "more from",
-                                "related",
-                            ]:
-                                if page_text not in pages_list:
-                                    pages_list.append(page_text)
+                        # Skip if it's just "Pages" label or navigation
+                        if (
+                            page_text
+                            and len(page_text) < 100
+                            and page_text.lower() not in _PAGES_SKIP
+                            and page_text not in pages_list
+                        ):
+                            pages_list.append(page_text)
 
             # Method 2: Fallback - find by text "Pages" and get siblings
             if not pages_list:
-                pages_section = soup.find(string=re.compile(r"^Pages$", re.I))
+                pages_section = soup.find(string=_PAGES_TEXT_RE)
                 if pages_section:
                     pages_parent = pages_section.find_parent()
                     if pages_parent:
                         page_items = pages_parent.find_all(["li", "span", "div", "a"])
                         for item in page_items:
                             page_text = item.get_text().strip()
-                            if page_text and len(page_text) < 100:
-                                # Skip if it's just "Pages" label or navigation
-                                if page_text.lower() not in [
-                                    "pages",
-                                    "see all",
-                                    "more from",
-                                    "related",
-                                ]:
-                                    if page_text not in pages_list:
-                                        pages_list.append(page_text)
-
-        # Plugins: "About this Plugin" (no Features section)
-        elif product_type == "plugin":
-            # Plugins typically don't have features list
-            pass
+                            # Skip if it's just "Pages" label or navigation
+                            if (
+                                page_text
+                                and len(page_text) < 100
+                                and page_text.lower() not in _PAGES_SKIP
+                                and page_text not in pages_list
+                            ):
+                                pages_list.append(page_text)
 
         # Components: "About this Component" (may have features)
         elif product_type == "component":
             # Components may have some features/tags
-            features_section = soup.find(string=re.compile(r"Features|About", re.I))
+            features_section = soup.find(string=_FEATURES_ABOUT_RE)
             if features_section:
                 features_parent = features_section.find_parent()
                 if features_parent:
@@ -658,16 +758,10 @@ class ProductParser:
                         if text and len(text) < 50:
                             features_list.append(text)
 
-        # Vectors: "About these Vectors" (no Features section)
-        elif product_type == "vector":
-            # Vectors typically don't have features list
-            pass
-
         # Infer features from text
-        text_lower = soup.get_text().lower()
-        is_responsive = any(term in text_lower for term in ["responsive", "mobile"])
-        has_animations = any(term in text_lower for term in ["animation", "animate", "effects"])
-        cms_integration = any(term in text_lower for term in ["cms", "contentful", "prismic"])
+        is_responsive = bool(_RESPONSIVE_RE.search(text_lower))
+        has_animations = bool(_ANIMATIONS_RE.search(text_lower))
+        cms_integration = bool(_CMS_RE.search(text_lower))
 
         return ProductFeatures(
             features=features_list[:20],  # Limit features
@@ -724,7 +818,7 @@ class ProductParser:
 
         return product_name, creator_name
 
-    def _extract_categories(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_categories(self, soup: BeautifulSoup, headings: Dict[str, List[Tag]]) -> List[str]:
         """Extract all categories from product page.
 
         Categories are typically found in a "Categories" section.
@@ -732,6 +826,7 @@ class ProductParser:
 
         Args:
             soup: BeautifulSoup object
+            headings: Section headings from _index_section_headings
 
         Returns:
             List of all category names
@@ -739,21 +834,14 @@ class ProductParser:
         categories = []
 
         # Method 1: Look for "Categories" heading (h6, h2, h3, etc.) and find sibling elements
-        categories_heading = None
-        for heading in soup.find_all(["h6", "h2", "h3", "h4"]):
-            heading_text = heading.get_text().strip()
-            if heading_text.lower() == "categories":
-                categories_heading = heading
-                break
+        categories_heading = self._first_heading(headings, "categories", ("h6", "h2", "h3", "h4"))
 
         if categories_heading:
             # Find parent section that contains the heading
             section = categories_heading.find_parent(["section", "div"])
             if section:
                 # Find all links in the section (categories are usually links)
-                category_links = section.find_all(
-                    "a", href=re.compile(r"/category/|/marketplace/category/")
-                )
+                category_links = section.find_all("a", href=_CATEGORY_HREF_RE)
                 for link in category_links:
                     category_text = link.get_text().strip()
                     if category_text and category_text.lower() != "categories":
@@ -761,18 +849,19 @@ class ProductParser:
 
                 # Also check spans/divs with text-label class (common pattern)
                 if not categories:
-                    category_elements = section.find_all(
-                        ["span", "div"], class_=re.compile(r"text-label|contentSidebarItem")
-                    )
+                    category_elements = section.find_all(["span", "div"], class_=_LABEL_CLASS_RE)
                     for elem in category_elements:
                         category_text = elem.get_text().strip()
-                        if category_text and len(category_text) < 100:
-                            if category_text.lower() not in ["categories", "see all"]:
-                                categories.append(category_text)
+                        if (
+                            category_text
+                            and len(category_text) < 100
+                            and category_text.lower() not in _CATEGORY_LINK_SKIP
+                        ):
+                            categories.append(category_text)
 
         # Method 2: Fallback - find by text "Categories" and get siblings
         if not categories:
-            categories_section = soup.find(string=re.compile(r"^Categories$", re.I))
+            categories_section = soup.find(string=_CATEGORIES_TEXT_RE)
             if categories_section:
                 categories_parent = categories_section.find_parent()
                 if categories_parent:
@@ -780,24 +869,21 @@ class ProductParser:
                     category_elements = categories_parent.find_all(["a", "span", "div"])
                     for elem in category_elements:
                         category_text = elem.get_text().strip()
-                        # Filter out non-category text
-                        if category_text and len(category_text) < 100:
-                            # Skip if it's just "Categories" label or navigation
-                            if category_text.lower() not in [
-                                "categories",
-                                "see all",
-                                "more from",
-                                "related",
-                            ]:
-                                categories.append(category_text)
+                        # Filter out non-category text ("Categories" label or navigation)
+                        if (
+                            category_text
+                            and len(category_text) < 100
+                            and category_text.lower() not in _CATEGORIES_SKIP
+                        ):
+                            categories.append(category_text)
 
         # Method 3: Find all category links on the page (href contains /category/)
-        category_links = soup.find_all("a", href=re.compile(r"/category/|/marketplace/category/"))
+        category_links = soup.find_all("a", href=_CATEGORY_HREF_RE)
         for link in category_links:
             category_text = link.get_text().strip()
             if category_text and category_text not in categories:
                 # Additional check - make sure it's not a navigation link
-                if category_text.lower() not in ["see all", "categories"]:
+                if category_text.lower() not in _CATEGORY_LINK_SKIP:
                     categories.append(category_text)
 
         # Remove duplicates while preserving order
@@ -810,3 +896,21 @@ class ProductParser:
                 unique_categories.append(cat)
 
         return unique_categories
+
+
+# Per-process parser used by ProductParser.parse_many workers
+_worker_parser: Optional[ProductParser] = None
+
+
+def _init_worker() -> None:
+    """Build one ProductParser per worker process."""
+    global _worker_parser
+    _worker_parser = ProductParser()
+
+
+def _parse_worker(job: Tuple[str, str, Optional[str]]) -> Optional[Product]:
+    """Parse a single (html, url, product_type) job in a worker process."""
+    html, url, product_type = job
+    # Also usable outside a pool started with _init_worker (e.g. called directly)
+    parser = _worker_parser or ProductParser()
+    return parser.parse(html, url, product_type)
@@ -1,6 +1,10 @@
 """Category scraper for fetching category pages."""
 
-from typing import Optional
+import asyncio
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
 
 import httpx
 
@@ -11,6 +15,29 @@ from src.utils.user_agents import get_random_user_agent
 
 logger = get_logger(__name__)
 
+# Connection pool for the scraper-owned client (reused across all category pages)
+_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+# Constant request headers; only the User-Agent is picked per request
+_BASE_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    """Write a text file via a temporary file, so a crash never leaves it half-written.
+
+    Args:
+        path: Destination file
+        text: File content
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f"{path.name}.tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    temp_path.replace(path)
+
 
 class CategoryScraper:
     """Scraper for category pages."""
@@ -22,7 +49,173 @@ class CategoryScraper:
             client: Optional httpx.AsyncClient instance
         """
         self.client = client
+        self._should_close_client = client is None
+        self._client_lock = asyncio.Lock()
         self.timeout = settings.timeout
+        # url -> {"etag", "last_modified", "file"}; loaded lazily from the cache index
+        self._cache_index: Optional[Dict[str, Dict[str, Optional[str]]]] = None
+        # Index entries added since the index was last written (see save_cache_index)
+        self._cache_index_dirty = False
+        self._cache_index_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        if self.client is None:
+            await self._get_client()
+            await self._prewarm_connection()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Write pending cache index entries and close the HTTP client if owned."""
+        await self.save_cache_index()
+        if self._should_close_client and self.client:
+            await self.client.aclose()
+            self.client = None
+
+    async def _prewarm_connection(self) -> None:
+        """Open a pooled connection (DNS + TCP + TLS) before the first real request.
+
+        Best effort: failures are logged and ignored.
+        """
+        try:
+            await self.client.head(settings.base_url, timeout=2.0)
+        except Exception as e:
+            logger.debug("connection_prewarm_failed", url=settings.base_url, error=str(e))
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating a pooled one on first use.
+
+        Returns:
+            httpx.AsyncClient reused for every category request
+        """
+        if self.client is None:
+            async with self._client_lock:
+                if self.client is None:
+                    self.client = httpx.AsyncClient(
+                        timeout=self.timeout,
+                        limits=_CLIENT_LIMITS,
+                        follow_redirects=True,
+                    )
+        return self.client
+
+    def _cache_dir(self) -> Path:
+        """Get Path object for the category cache directory."""
+        return Path(settings.category_cache_dir)
+
+    def _load_cache_index(self) -> Dict[str, Dict[str, Optional[str]]]:
+        """Load the category cache index (validators per URL) once per scraper.
+
+        Returns:
+            Dict mapping category URL to its cached ETag, Last-Modified and HTML file name
+        """
+        if self._cache_index is None:
+            self._cache_index = {}
+            index_path = self._cache_dir() / "index.json"
+            if settings.category_cache_enabled and index_path.exists():
+                try:
+                    with open(index_path, "r", encoding="utf-8") as f:
+                        self._cache_index = json.load(f)
+                except Exception as e:
+                    logger.warning("category_cache_index_load_error", error=str(e))
+        return self._cache_index
+
+    def _get_cache_validators(self, url: str) -> Dict[str, str]:
+        """Build conditional request headers from the cached validators for a URL.
+
+        Args:
+            url: Full category URL
+
+        Returns:
+            Dict with If-None-Match / If-Modified-Since headers (empty if not cached)
+        """
+        if not settings.category_cache_enabled:
+            return {}
+
+        entry = self._load_cache_index().get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    async def _load_cached_category(self, url: str) -> Optional[str]:
+        """Load cached category HTML for a URL.
+
+        Args:
+            url: Full category URL
+
+        Returns:
+            Cached HTML content or None if missing
+        """
+        entry = self._load_cache_index().get(url)
+        if not entry:
+            return None
+
+        try:
+            cache_file = self._cache_dir() / entry["file"]
+            return await asyncio.to_thread(cache_file.read_text, encoding="utf-8")
+        except Exception as e:
+            logger.warning("category_cache_load_error", url=url, error=str(e))
+            return None
+
+    async def _save_cached_category(self, url: str, response: httpx.Response) -> None:
+        """Save category HTML to the cache and record its validators in the index.
+
+        Only responses with an ETag or Last-Modified header are cached, since
+        others can never be revalidated. The index itself is written by
+        save_cache_index, once per batch rather than once per page.
+
+        Args:
+            url: Full category URL
+            response: Successful HTTP response
+        """
+        if not settings.category_cache_enabled:
+            return
+
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if not etag and not last_modified:
+            return
+
+        try:
+            file_name = f"{hashlib.sha256(url.encode()).hexdigest()}.html"
+            await asyncio.to_thread(
+                _write_text_atomic, self._cache_dir() / file_name, response.text
+            )
+        except Exception as e:
+            logger.warning("category_cache_save_error", url=url, error=str(e))
+            return
+
+        index = self._load_cache_index()
+        index[url] = {"etag": etag, "last_modified": last_modified, "file": file_name}
+        self._cache_index_dirty = True
+
+    async def save_cache_index(self) -> None:
+        """Write the category cache index to disk if it has new entries.
+
+        The index is replaced atomically, so an interrupted write keeps the previous one.
+        """
+        async with self._cache_index_lock:
+            if not self._cache_index_dirty:
+                return
+            # Serialized on the event loop, so concurrent saves cannot change it mid-dump
+            index_json = json.dumps(self._cache_index, indent=2)
+            self._cache_index_dirty = False
+            try:
+                await asyncio.to_thread(
+                    _write_text_atomic, self._cache_dir() / "index.json", index_json
+                )
+            except Exception as e:
+                self._cache_index_dirty = True
+                logger.warning("category_cache_index_save_error", error=str(e))
 
     async def scrape_category(self, category_url: str) -> Optional[str]:
         """Scrape a category page.
@@ -39,20 +232,24 @@ class CategoryScraper:
         else:
             full_url = category_url
 
-        headers = {
-            "User-Agent": get_random_user_agent(),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-        }
+        headers = {**_BASE_HEADERS, "User-Agent": get_random_user_agent()}
 
         try:
-            if self.client:
-                response = await self.client.get(full_url, headers=headers, timeout=self.timeout)
-            else:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(full_url, headers=headers, timeout=self.timeout)
+            client = await self._get_client()
+            conditional_headers = {**headers, **self._get_cache_validators(full_url)}
+            response = await client.get(full_url, headers=conditional_headers, timeout=self.timeout)
+
+            # 304 Not Modified: serve the cached copy without transferring the body again
+            if response.status_code == 304:
+                cached_html = await self._load_cached_category(full_url)
+                if cached_html is not None:
+                    logger.info("category_cache_hit", url=category_url)
+                    return cached_html
+                # Cached file is gone - fetch the full page unconditionally
+                response = await client.get(full_url, headers=headers, timeout=self.timeout)
 
             response.raise_for_status()
+            await self._save_cached_category(full_url, response)
             logger.info("category_scraped", url=category_url, status_code=response.status_code)
             return response.text
 
@@ -60,6 +257,28 @@ class CategoryScraper:
             logger.error("category_scrape_error", url=category_url, error=str(e))
             return None
 
+    async def scrape_many(
+        self, category_urls: List[str], concurrency: Optional[int] = None
+    ) -> List[Optional[str]]:
+        """Scrape many category pages concurrently.
+
+        Args:
+            category_urls: Category URLs
+            concurrency: Max requests in flight (None uses settings.max_concurrent_requests)
+
+        Returns:
+            HTML content (or None if failed) for each URL, in input order
+        """
+        semaphore = asyncio.BoundedSemaphore(concurrency or settings.max_concurrent_requests)
+
+        async def scrape_one(category_url: str) -> Optional[str]:
+            async with semaphore:
+                return await self.scrape_category(category_url)
+
+        pages = await asyncio.gather(*(scrape_one(url) for url in category_urls))
+        await self.save_cache_index()
+        return pages
+
     @retry_on_network_error(max_retries=3)
     async def scrape_category_with_retry(self, category_url: str) -> Optional[str]:
         """Scrape a category page with retry logic.
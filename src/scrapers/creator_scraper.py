@@ -1,10 +1,18 @@
 """Creator scraper for fetching user profile pages."""
 
+import asyncio
 import re
-from typing import Optional
+from typing import List, Optional
 
 import httpx
 
+try:
+    import h2  # noqa: F401 - enables HTTP/2 support in httpx
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 from src.config.settings import settings
 from src.utils.logger import get_logger
 from src.utils.rate_limiter import get_rate_limiter
@@ -13,6 +21,14 @@ from src.utils.user_agents import get_random_user_agent
 
 logger = get_logger(__name__)
 
+# Pattern: /@{username}/ or https://.../@{username}/
+_USERNAME_RE = re.compile(r"/@([^/]+)/?")
+
+# Wider pool for bulk profile scraping; the rate limiter still caps request rate
+_CLIENT_LIMITS = httpx.Limits(
+    max_keepalive_connections=64, max_connections=128, keepalive_expiry=30.0
+)
+
 
 class CreatorScraper:
     """Scraper for creator/user profile pages."""
@@ -42,7 +58,11 @@ class CreatorScraper:
                 timeout=timeout,
                 headers={"User-Agent": get_random_user_agent()},
                 follow_redirects=True,
+                # HTTP/2 multiplexes profile requests over one connection when h2 is installed
+                http2=HTTP2_AVAILABLE,
+                limits=_CLIENT_LIMITS,
             )
+            await self._prewarm_connection()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -50,6 +70,16 @@ class CreatorScraper:
         if self._should_close_client and self.client:
             await self.client.aclose()
 
+    async def _prewarm_connection(self) -> None:
+        """Open a pooled connection (DNS + TCP + TLS) before the first real request.
+
+        Best effort: failures are logged and ignored.
+        """
+        try:
+            await self.client.head(settings.base_url, timeout=2.0)
+        except Exception as e:
+            logger.debug("connection_prewarm_failed", url=settings.base_url, error=str(e))
+
     def extract_username_from_url(self, url: str) -> Optional[str]:
         """Extract username from profile URL.
 
@@ -59,9 +89,7 @@ class CreatorScraper:
         Returns:
             Username (without @) or None
         """
-        # Pattern: /@{username}/ or https://.../@{username}/
-        pattern = r"/@([^/]+)/?"
-        match = re.search(pattern, url)
+        match = _USERNAME_RE.search(url)
         if match:
             return match.group(1)
         return None
@@ -75,17 +103,21 @@ class CreatorScraper:
         Returns:
             Normalized full URL
         """
-        # Convert HttpUrl to string if needed
-        url_str = str(url)
+        # Convert HttpUrl to string if needed (plain strings are used as-is) and strip
+        # trailing slashes once, so every branch builds the final URL directly
+        url_str = (url if type(url) is str else str(url)).rstrip("/")
 
+        # Absolute URLs are the common case (already normalized by scrape())
         if url_str.startswith("http"):
-            return url_str.rstrip("/")
-        elif url_str.startswith("/@"):
-            return f"{settings.base_url}{url_str}".rstrip("/")
+            return url_str
+
+        base_url = settings.base_url
+        if url_str.startswith("/@"):
+            return f"{base_url}{url_str}"
         elif url_str.startswith("@"):
-            return f"{settings.base_url}/{url_str}".rstrip("/")
+            return f"{base_url}/{url_str}"
         else:
-            return f"{settings.base_url}/@{url_str}".rstrip("/")
+            return f"{base_url}/@{url_str}"
 
     async def fetch_profile_page(self, url: str) -> Optional[str]:
         """Fetch profile page HTML with retry and rate limiting.
@@ -127,6 +159,28 @@ class CreatorScraper:
             logger.error("profile_fetch_error", url=url, error=str(e), error_type=type(e).__name__)
             return None
 
+    async def scrape_many(
+        self, urls: List[str], concurrency: Optional[int] = None
+    ) -> List[Optional[str]]:
+        """Fetch many profile pages concurrently.
+
+        The shared rate limiter still gates the overall request rate.
+
+        Args:
+            urls: Profile URLs (relative like /@username/ or full URLs)
+            concurrency: Max requests in flight (None uses settings.max_concurrent_requests)
+
+        Returns:
+            HTML content (or None if failed) for each URL, in input order
+        """
+        semaphore = asyncio.BoundedSemaphore(concurrency or settings.max_concurrent_requests)
+
+        async def fetch_one(url: str) -> Optional[str]:
+            async with semaphore:
+                return await self.fetch_profile_page(url)
+
+        return await asyncio.gather(*(fetch_one(url) for url in urls))
+
     async def scrape(self, url: str) -> Optional[dict]:
         """Scrape a creator profile page.
 
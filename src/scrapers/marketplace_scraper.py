@@ -1,12 +1,17 @@
 """Main marketplace scraper orchestrator."""
 
 import asyncio
-from typing import Any, Dict, List, Optional
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
 
 import httpx
 from tqdm.asyncio import tqdm
 
 from src.config.settings import settings
+from src.models.creator import Creator
+from src.models.product import Product
 from src.parsers.category_parser import CategoryParser
 from src.parsers.creator_parser import CreatorParser
 from src.parsers.product_parser import ProductParser
@@ -17,17 +22,90 @@ from src.scrapers.sitemap_scraper import SitemapScraper
 from src.storage.database import DatabaseStorage
 from src.storage.file_storage import FileStorage
 from src.utils.checkpoint import CheckpointManager
+from src.utils.concurrency import AdmissionController
+from src.utils.http_client import create_client, get_shared_client
 from src.utils.logger import get_logger
 from src.utils.metrics import get_metrics
 
 logger = get_logger(__name__)
 
+# Sitemap retry schedule: capped exponential backoff (0s, 1s, 2s, 4s, 8s, 16s, 30s)
+_SITEMAP_RETRY_ATTEMPTS = 7
+_SITEMAP_RETRY_BASE_WAIT = 1.0
+_SITEMAP_RETRY_MAX_WAIT = 30.0
+
+# Background storage writers: scraped products are queued and saved by these tasks
+_STORAGE_WRITERS = 4
+_WRITE_QUEUE_SIZE = 1000
+# Products written to the database per bulk insert
+_DB_BATCH_SIZE = 100
+# Batch checkpoint saving: save every 50 URLs instead of after each one
+_CHECKPOINT_BATCH_SIZE = 50
+
+# Creator fields merged from the profile page into product.creator: filled only when the
+# product page left them empty / always taken from the profile when present
+_CREATOR_FILL_FIELDS = ("avatar_url", "name", "bio", "website")
+_CREATOR_OVERRIDE_FIELDS = ("social_media", "stats")
+
+
+def _product_url_key(url: str) -> int:
+    """Get the deduplication key of a product URL.
+
+    URLs that differ only in case, query string (tracking parameters), fragment or a
+    trailing slash point to the same product, so they share a key.
+
+    Args:
+        url: Product URL
+
+    Returns:
+        hash() of the normalized URL
+    """
+    parts = urlsplit(url)
+    return hash(f"{parts.netloc}{parts.path.rstrip('/')}".lower())
+
+
+def _sitemap_retry_base_delay(attempt_num: int) -> float:
+    """Get the backoff delay (without jitter) before a sitemap fetch attempt.
+
+    Args:
+        attempt_num: 1-based attempt number (the first attempt is not delayed)
+
+    Returns:
+        Delay in seconds
+    """
+    if attempt_num <= 1:
+        return 0.0
+    return min(_SITEMAP_RETRY_MAX_WAIT, _SITEMAP_RETRY_BASE_WAIT * 2 ** (attempt_num - 2))
+
+
+def _sitemap_retry_delay(attempt_num: int) -> float:
+    """Get the delay before a sitemap fetch attempt, with jitter if enabled.
+
+    Args:
+        attempt_num: 1-based attempt number
+
+    Returns:
+        Delay in seconds
+    """
+    delay = _sitemap_retry_base_delay(attempt_num)
+    if delay and settings.retry_jitter:
+        # Random 0-20% of the base delay, as in retry_async
+        delay += random.uniform(0, delay * 0.2)
+    return delay
+
 
 class MarketplaceScraper:
     """Main orchestrator for scraping Framer Marketplace."""
 
-    def __init__(self):
-        """Initialize marketplace scraper."""
+    def __init__(self, owns_client: bool = True):
+        """Initialize marketplace scraper.
+
+        Args:
+            owns_client: If True, create a client on entry and close it on exit. If False,
+                use the shared client from get_shared_client() and leave it open for later
+                runs (close it with close_shared_client() at process exit)
+        """
+        self.owns_client = owns_client
         self.sitemap_scraper: Optional[SitemapScraper] = None
         self.product_scraper: Optional[ProductScraper] = None
         self.creator_scraper: Optional[CreatorScraper] = None
@@ -51,43 +129,56 @@ class MarketplaceScraper:
             "categories_failed": 0,
         }
 
-        # Deduplication tracking
-        self.seen_product_ids: set = set()
-        self.seen_product_urls: set = set()
-        self.seen_creator_ids: set = set()
+        # Deduplication tracking. Product URLs (normalized, see _product_url_key) and
+        # creator usernames are kept as 64-bit hash() values: an int is far smaller than
+        # the string, and a collision (which would skip a DB write) is ~1e-10 likely even
+        # at 100k entries. Only valid within this process.
+        self.seen_product_url_hashes: set = set()
+        self.seen_creator_id_hashes: set = set()
+
+        # Adaptive cap on in-flight scrapes (None: fixed max_concurrent_requests)
+        self.admission: Optional[AdmissionController] = (
+            AdmissionController(settings.max_concurrent_requests, settings.adaptive_target_latency)
+            if settings.adaptive_concurrency
+            else None
+        )
+        # Cap on in-flight scrapes otherwise, shared by every batch running at once (e.g. the
+        # main batch and the background scrape of refreshed sitemap URLs). Starts at
+        # max_concurrent_requests and grows to the largest limit a batch asks for
+        self._scrape_slots = asyncio.Semaphore(settings.max_concurrent_requests)
+        self._scrape_slot_count = settings.max_concurrent_requests
+
+        # Creator profiles fetched during this run (profile URL -> parsed creator), shared
+        # by all products of a creator; in-flight fetches are awaited instead of repeated
+        self._creator_cache: Dict[str, asyncio.Future] = {}
+
+        # Product persistence queue, drained by background writers while in the context
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_tasks: List[asyncio.Task] = []
+        # Products ((url, product) pairs) and creators waiting for the next bulk database
+        # insert; the lock keeps one bulk insert in flight at a time
+        self._product_db_buffer: List[tuple[str, Product]] = []
+        self._creator_db_buffer: List[tuple[str, Creator]] = []
+        self._db_flush_lock = asyncio.Lock()
+        # Background scrapes of URLs found by a sitemap refresh (awaited on exit)
+        self._background_scrapes: set = set()
         self.duplicate_count: int = 0
 
+        # Sitemap refresh state (used when scraping from a cached sitemap)
+        self.types_to_scrape: Optional[List[str]] = None
+        self.sitemap_product_urls: set = set()
+        self.fresh_sitemap_obtained: bool = True
+        self.refresh_lock: Optional[asyncio.Lock] = None
+        self._sitemap_refresh_task: Optional[asyncio.Task] = None
+        # Parsed sitemap (data, cache_used, cache_age_hours), fetched once per instance
+        self._sitemap_cache: Optional[tuple[Dict[str, Any], bool, float]] = None
+        # Hash of the cached sitemap XML scraping started from (None: started fresh)
+        self._cached_sitemap_hash: Optional[int] = None
+
     async def __aenter__(self):
         """Async context manager entry."""
-        # Set explicit timeouts: connect, read, write, pool
-        # This ensures requests are properly cancelled if they exceed timeout
-        timeout = httpx.Timeout(
-            connect=5.0,  # Connection timeout: 5s
-            read=settings.timeout,  # Read timeout: 12s (from settings)
-            write=5.0,  # Write timeout: 5s
-            pool=5.0,  # Pool timeout: 5s
-        )
-        from src.utils.user_agents import get_random_user_agent
-
-        # Use realistic browser headers to avoid bot detection
-        user_agent = get_random_user_agent()
-        self.client = httpx.AsyncClient(
-            timeout=timeout,
-            headers={
-                "User-Agent": user_agent,
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.9",
-                # Only request gzip/deflate - httpx auto-decompresses these, but NOT Brotli (br)
-                "Accept-Encoding": "gzip, deflate",
-                "Referer": settings.marketplace_url,
-                "Connection": "keep-alive",
-                "Sec-Fetch-Dest": "document",
-                "Sec-Fetch-Mode": "navigate",
-                "Sec-Fetch-Site": "same-origin",
-                "Upgrade-Insecure-Requests": "1",
-            },
-            follow_redirects=True,
-        )
+        # Reuse the process-wide client (warm connections) unless this scraper owns one
+        self.client = create_client() if self.owns_client else get_shared_client()
 
         self.sitemap_scraper = SitemapScraper(self.client)
         self.product_scraper = ProductScraper(self.client)
@@ -97,11 +188,38 @@ class MarketplaceScraper:
         # Initialize refresh lock
         self.refresh_lock = asyncio.Lock()
 
+        # Start background storage writers
+        self._write_queue = asyncio.Queue(maxsize=_WRITE_QUEUE_SIZE)
+        self._writer_tasks = [
+            asyncio.create_task(self._storage_writer()) for _ in range(_STORAGE_WRITERS)
+        ]
+
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.client:
+        if self._sitemap_refresh_task and not self._sitemap_refresh_task.done():
+            self._sitemap_refresh_task.cancel()
+            await asyncio.gather(self._sitemap_refresh_task, return_exceptions=True)
+        # Background scrapes may still queue products, so they finish (or, on error, are
+        # cancelled) before the writers are drained
+        if self._background_scrapes:
+            if exc_type is not None:
+                for task in self._background_scrapes:
+                    task.cancel()
+            await asyncio.gather(*list(self._background_scrapes), return_exceptions=True)
+        # Writers stop at the sentinel, after saving everything queued before it
+        for _ in self._writer_tasks:
+            await self._write_queue.put(None)
+        await self._write_queue.join()
+        await asyncio.gather(*self._writer_tasks)
+        self._writer_tasks = []
+        await self._flush_product_db_buffer()
+        await self._flush_creator_db_buffer()
+        if self.category_scraper:
+            await self.category_scraper.save_cache_index()
+        self._write_queue = None
+        if self.client and self.owns_client:
             await self.client.aclose()
 
     async def scrape_product(
@@ -118,7 +236,8 @@ class MarketplaceScraper:
             save_checkpoint_immediately: If False, checkpoint is saved in batch (for performance)
 
         Returns:
-            True if successful, False otherwise
+            True if successful (inside the context manager: scraped and queued for saving),
+            False otherwise
         """
         # Check checkpoint if enabled
         if skip_if_processed and settings.checkpoint_enabled:
@@ -126,17 +245,27 @@ class MarketplaceScraper:
                 logger.debug("product_already_processed", url=url)
                 return True
 
+        # Already scraped in this run (e.g. listed again by a refreshed sitemap): skip the
+        # fetch and parse entirely
+        if _product_url_key(url) in self.seen_product_url_hashes:
+            self.duplicate_count += 1
+            logger.warning("duplicate_url_skipped", url=url)
+            return True
+
         try:
             # Scrape product page
             product_data = await self.product_scraper.scrape(url)
             if product_data is None:
                 self.stats["products_failed"] += 1
                 if settings.checkpoint_enabled:
-                    self.checkpoint_manager.add_failed(url)
+                    self.checkpoint_manager.add_failed(
+                        url, save_immediately=save_checkpoint_immediately
+                    )
                 return False
 
-            # Parse HTML
-            product = self.product_parser.parse(
+            # Parse HTML in a worker thread, so other requests progress meanwhile
+            product = await asyncio.to_thread(
+                self.product_parser.parse,
                 product_data["html"],
                 product_data["url"],
                 product_data["type"],
@@ -144,65 +273,115 @@ class MarketplaceScraper:
             if product is None:
                 self.stats["products_failed"] += 1
                 if settings.checkpoint_enabled:
-                    self.checkpoint_manager.add_failed(url)
+                    self.checkpoint_manager.add_failed(
+                        url, save_immediately=save_checkpoint_immediately
+                    )
                 return False
 
+            # Creator to save along with the product (only once per creator)
+            new_creator = None
+
             # Scrape creator if available
             if product.creator and product.creator.profile_url:
-                creator_data = await self.creator_scraper.scrape(product.creator.profile_url)
-                if creator_data:
-                    # Parse creator HTML to get full creator data (including avatar)
-                    creator = self.creator_parser.parse(creator_data["html"], creator_data["url"])
-                    if creator:
-                        # Save creator as separate file (only once per creator)
-                        await self.storage.save_creator_json(creator)
-                        # Save creator to database
-                        await self.db_storage.save_creator_db(creator)
-                        self.stats["creators_scraped"] = self.stats.get("creators_scraped", 0) + 1
-
-                        # Update product.creator with full data (merge to preserve avatar from product page if available)
-                        if not product.creator.avatar_url:
-                            product.creator.avatar_url = creator.avatar_url
-                        if not product.creator.name:
-                            product.creator.name = creator.name
-                        if not product.creator.bio:
-                            product.creator.bio = creator.bio
-                        if not product.creator.website:
-                            product.creator.website = creator.website
-                        if creator.social_media:
-                            product.creator.social_media = creator.social_media
-                        if creator.stats:
-                            product.creator.stats = creator.stats
+                creator, fetched = await self._get_creator(product.creator.profile_url)
+                if creator:
+                    if fetched:
+                        new_creator = creator
+                        self.stats["creators_scraped"] += 1
+
+                    # Update product.creator with full data (merge to preserve avatar from product page if available)
+                    product_creator = product.creator
+                    for field in _CREATOR_FILL_FIELDS:
+                        if not getattr(product_creator, field):
+                            setattr(product_creator, field, getattr(creator, field))
+                    for field in _CREATOR_OVERRIDE_FIELDS:
+                        value = getattr(creator, field)
+                        if value:
+                            setattr(product_creator, field, value)
 
             # Track seen URLs for refresh sitemap deduplication
             # Main deduplication happens in filter_urls_by_type, but we still track
             # for refresh sitemap which may add new URLs during scraping
+            # Keyed by the normalized URL, so sitemap URLs checked on refresh match
+            product_url_hash = _product_url_key(str(product.url))
             is_duplicate = False
-            if product.url in self.seen_product_urls:
+            if product_url_hash in self.seen_product_url_hashes:
                 logger.warning("duplicate_product_url", product_id=product.id, url=url)
                 is_duplicate = True
                 self.duplicate_count += 1
             else:
-                self.seen_product_urls.add(product.url)
-                self.seen_product_ids.add(product.id)
-
-            # Log record count before save
-            logger.debug(
-                "product_before_save",
-                product_id=product.id,
-                total_scraped=self.stats["products_scraped"],
-                total_failed=self.stats["products_failed"],
+                self.seen_product_url_hashes.add(product_url_hash)
+                # The requested URL too, in case it differs from the canonical product URL
+                self.seen_product_url_hashes.add(_product_url_key(url))
+
+            if is_duplicate:
+                logger.warning("db_write_skipped_duplicate", product_id=product.id)
+
+            save_job = (url, product, new_creator, is_duplicate, save_checkpoint_immediately)
+            if self._write_queue is None:
+                return await self._save_product(*save_job)
+
+            # Hand saving to the background writers so this slot can fetch the next page
+            await self._write_queue.put(save_job)
+            return True
+
+        except Exception as e:
+            error_type = type(e).__name__
+            logger.error(
+                "product_scrape_exception",
+                url=url,
+                error=str(e),
+                error_type=error_type,
             )
+            self.stats["products_failed"] += 1
+            self.metrics.record_product_failed(error_type=error_type, url=url)
+            if settings.checkpoint_enabled:
+                self.checkpoint_manager.add_failed(
+                    url, save_immediately=save_checkpoint_immediately
+                )
+            return False
 
-            # Save product
-            success = await self.storage.save_product_json(product)
+    async def _save_product(
+        self,
+        url: str,
+        product: Product,
+        creator: Optional[Creator],
+        is_duplicate: bool,
+        save_checkpoint_immediately: bool,
+    ) -> bool:
+        """Save a scraped product (and its newly fetched creator) and record the result.
 
+        Args:
+            url: Product URL
+            product: Parsed product
+            creator: Creator to save alongside the product (None if already saved)
+            is_duplicate: Skip the DB write (duplicate from refresh sitemap)
+            save_checkpoint_immediately: If False, checkpoint is saved in batch (for performance)
+
+        Returns:
+            True if the product JSON was saved, False otherwise
+        """
+        try:
+            # The writes are independent, so all of them are issued together
+            writes = [self.storage.save_product_json(product)]
+            if creator:
+                # Save creator as separate file and to database
+                writes.append(self.storage.save_creator_json(creator))
+                if save_checkpoint_immediately:
+                    writes.append(asyncio.to_thread(self.db_storage.save_creator_db_sync, creator))
             # Save product to database (duplicates already filtered in filter_urls_by_type)
             # Only skip if this is a duplicate from refresh sitemap
-            if not is_duplicate:
-                await self.db_storage.save_product_db(product)
-            else:
-                logger.warning("db_write_skipped_duplicate", product_id=product.id)
+            if not is_duplicate and save_checkpoint_immediately:
+                writes.append(asyncio.to_thread(self.db_storage.save_product_db_sync, product))
+            success, *_ = await asyncio.gather(*writes)
+            if creator and not save_checkpoint_immediately:
+                # Kept with the product URL: if the creator row is lost, the product is retried
+                self._creator_db_buffer.append((url, creator))
+            if not is_duplicate and not save_checkpoint_immediately:
+                # Batch mode: bulk-inserted with the buffer before the next checkpoint save.
+                # Buffered right before the checkpoint update below (no await in between),
+                # so a checkpoint copy never holds a URL whose row is not buffered yet.
+                self._product_db_buffer.append((url, product))
 
             if success:
                 self.stats["products_scraped"] += 1
@@ -222,14 +401,20 @@ class MarketplaceScraper:
                 self.stats["products_failed"] += 1
                 self.metrics.record_product_failed()
                 if settings.checkpoint_enabled:
-                    self.checkpoint_manager.add_failed(url)
+                    self.checkpoint_manager.add_failed(
+                        url, save_immediately=save_checkpoint_immediately
+                    )
 
+            if len(self._product_db_buffer) >= _DB_BATCH_SIZE:
+                await self._flush_product_db_buffer()
+            if len(self._creator_db_buffer) >= _DB_BATCH_SIZE:
+                await self._flush_creator_db_buffer()
             return success
 
         except Exception as e:
             error_type = type(e).__name__
             logger.error(
-                "product_scrape_exception",
+                "product_save_exception",
                 url=url,
                 error=str(e),
                 error_type=error_type,
@@ -237,65 +422,143 @@ class MarketplaceScraper:
             self.stats["products_failed"] += 1
             self.metrics.record_product_failed(error_type=error_type, url=url)
             if settings.checkpoint_enabled:
-                self.checkpoint_manager.add_failed(url)
+                self.checkpoint_manager.add_failed(
+                    url, save_immediately=save_checkpoint_immediately
+                )
             return False
 
+    async def _storage_writer(self) -> None:
+        """Save queued products until the None sentinel is received."""
+        while True:
+            save_job = await self._write_queue.get()
+            try:
+                if save_job is None:
+                    return
+                await self._save_product(*save_job)
+            finally:
+                self._write_queue.task_done()
+
+    async def flush_writes(self) -> None:
+        """Wait until every queued product has been saved, including buffered DB rows."""
+        if self._write_queue is not None:
+            await self._write_queue.join()
+        await self._flush_db_buffers()
+
+    async def _flush_db_buffers(self) -> None:
+        """Write all buffered products and creators to the database."""
+        await self._flush_product_db_buffer()
+        await self._flush_creator_db_buffer()
+
+    async def _save_checkpoint(self) -> None:
+        """Save the checkpoint, storing the buffered rows of its URLs first."""
+        await self.checkpoint_manager.flush_async(self.stats, before_save=self._flush_db_buffers)
+
+    async def _flush_product_db_buffer(self) -> None:
+        """Write buffered products to the database in one bulk insert.
+
+        A bulk insert still in progress is waited for first, so once this returns every
+        product buffered before the call is in the database. If the insert fails, the
+        URLs of its products are moved back to the checkpoint's failed set.
+        """
+        async with self._db_flush_lock:
+            if not self._product_db_buffer:
+                return
+            entries, self._product_db_buffer = self._product_db_buffer, []
+            products = [product for _, product in entries]
+            saved = await asyncio.to_thread(self.db_storage.save_products_batch_db_sync, products)
+            if not saved and self.db_storage.is_available():
+                logger.error("product_db_batch_failed", count=len(products))
+                if settings.checkpoint_enabled:
+                    self.checkpoint_manager.mark_failed(url for url, _ in entries)
+
+    async def _flush_creator_db_buffer(self) -> None:
+        """Write buffered creators to the database in one bulk insert.
+
+        Works like _flush_product_db_buffer. The same creator can be buffered twice
+        (e.g. reached through two spellings of its profile URL), so only the latest entry
+        per username is inserted: a multi-row upsert may not affect a row twice.
+        """
+        async with self._db_flush_lock:
+            if not self._creator_db_buffer:
+                return
+            entries, self._creator_db_buffer = self._creator_db_buffer, []
+            creators = list({creator.username: creator for _, creator in entries}.values())
+            saved = await asyncio.to_thread(self.db_storage.save_creators_batch_db_sync, creators)
+            if not saved and self.db_storage.is_available():
+                logger.error("creator_db_batch_failed", count=len(creators))
+                if settings.checkpoint_enabled:
+                    self.checkpoint_manager.mark_failed(url for url, _ in entries)
+
+    async def _get_creator(self, profile_url: str) -> tuple[Optional[Creator], bool]:
+        """Fetch and parse a creator profile once per run.
+
+        Concurrent calls for the same profile share one fetch. Failed fetches are not
+        cached, so a later product of the same creator tries again.
+
+        Args:
+            profile_url: Creator profile URL
+
+        Returns:
+            Tuple of (creator or None, fetched) - fetched is True only for the call that
+            actually fetched the profile (and should save it)
+        """
+        key = str(profile_url)
+        future = self._creator_cache.get(key)
+        if future is not None:
+            return await asyncio.shield(future), False
+
+        future = asyncio.get_running_loop().create_future()
+        self._creator_cache[key] = future
+        creator = None
+        try:
+            creator_data = await self.creator_scraper.scrape(profile_url)
+            if creator_data:
+                # Parse creator HTML to get full creator data (including avatar)
+                creator = await asyncio.to_thread(
+                    self.creator_parser.parse, creator_data["html"], creator_data["url"]
+                )
+        finally:
+            if creator is None:
+                del self._creator_cache[key]
+            # Waiting products get None if this fetch failed or was cancelled
+            future.set_result(creator)
+        return creator, True
+
     async def _get_sitemap_with_initial_retry(self) -> tuple[Dict[str, Any], bool, float]:
         """Get sitemap with initial retry attempts before falling back to cache.
 
-        Retry sequence: Fibonacci sequence in seconds (0s, 1s, 1s, 2s, 3s, 5s, 8s, 13s, 21s, 34s, 55s, 89s, 144s, 233s, 377s)
-        Total max wait: ~16.4 minutes (986 seconds) before using cache.
+        Retry sequence: capped exponential backoff with jitter (0s, 1s, 2s, 4s, 8s, 16s, 30s),
+        ~1 minute of waiting at most. As soon as an attempt is answered from the sitemap
+        cache, the cached sitemap is returned and further refresh attempts are left to
+        _background_sitemap_refresh() so scraping can start immediately.
 
         Returns:
             Tuple of (sitemap_data, cache_used, cache_age_hours)
         """
-        retry_delays = [
-            0,
-            1,
-            1,
-            2,
-            3,
-            5,
-            8,
-            13,
-            21,
-            34,
-            55,
-            89,
-            144,
-            233,
-            377,
-        ]  # Fibonacci sequence in seconds
-        total_attempts = len(retry_delays)
-
-        total_max_wait = sum(retry_delays)
-        total_max_wait_minutes = round(total_max_wait / 60, 2)
+        total_attempts = _SITEMAP_RETRY_ATTEMPTS
+
+        total_max_wait = sum(_sitemap_retry_base_delay(n) for n in range(1, total_attempts + 1))
         logger.info(
             "sitemap_initial_retry_start",
             total_attempts=total_attempts,
             max_wait_seconds=total_max_wait,
-            max_wait_minutes=total_max_wait_minutes,
-            message=f"Starting sitemap fetch with {total_attempts} retry attempts (max wait: {total_max_wait}s / {total_max_wait_minutes} minutes)",
+            message=f"Starting sitemap fetch with {total_attempts} retry attempts (max wait: ~{total_max_wait:.0f}s)",
         )
 
-        for attempt_num, delay_seconds in enumerate(retry_delays, 1):
+        total_wait = 0.0
+        for attempt_num in range(1, total_attempts + 1):
             # Wait before retry (except first attempt)
+            delay_seconds = _sitemap_retry_delay(attempt_num)
             if delay_seconds > 0:
-                # Format wait time: show seconds for < 60s, minutes for >= 60s
-                if delay_seconds < 60:
-                    wait_display = f"{delay_seconds}s"
-                else:
-                    wait_display = f"{delay_seconds}s ({round(delay_seconds / 60, 1)}min)"
-
                 logger.info(
                     "sitemap_retry_wait",
                     attempt=attempt_num,
                     total=total_attempts,
-                    wait_seconds=delay_seconds,
-                    wait_minutes=round(delay_seconds / 60, 2) if delay_seconds >= 60 else 0,
-                    message=f"Waiting {wait_display} before retry attempt {attempt_num}/{total_attempts}",
+                    wait_seconds=round(delay_seconds, 2),
+                    message=f"Waiting {delay_seconds:.1f}s before retry attempt {attempt_num}/{total_attempts}",
                 )
                 await asyncio.sleep(delay_seconds)
+                total_wait += delay_seconds
 
             try:
                 logger.info(
@@ -310,30 +573,29 @@ class MarketplaceScraper:
 
                 # If we got fresh sitemap (not from cache), parse and return
                 if xml_content and not cache_used:
-                    total_wait = sum(retry_delays[:attempt_num])
-                    total_wait_minutes = round(total_wait / 60, 2)
                     logger.info(
                         "sitemap_fetch_success_after_retry",
                         attempt=attempt_num,
-                        total_wait_seconds=total_wait,
-                        total_wait_minutes=total_wait_minutes,
-                        message=f"✅ Successfully fetched fresh sitemap on attempt {attempt_num}/{total_attempts} (waited {total_wait}s / {total_wait_minutes} minutes total)",
+                        total_wait_seconds=round(total_wait, 2),
+                        message=f"✅ Successfully fetched fresh sitemap on attempt {attempt_num}/{total_attempts} (waited {total_wait:.1f}s total)",
                     )
                     # Parse and return
                     sitemap_data = self.sitemap_scraper.parse_sitemap(xml_content)
                     return (sitemap_data, False, 0.0)
 
-                # If we got cached sitemap, it means upstream is still failing
-                # Continue to next retry attempt
+                # Cached sitemap means upstream is still failing - start scraping from the
+                # cache now and keep retrying in background (see scrape())
                 if xml_content and cache_used:
                     logger.warning(
-                        "sitemap_retry_still_cache",
+                        "sitemap_retry_using_cache",
                         attempt=attempt_num,
                         total=total_attempts,
                         cache_age_hours=cache_age_hours,
-                        message=f"Attempt {attempt_num}/{total_attempts} still returned cached sitemap ({cache_age_hours}h old) - will retry",
+                        message=f"Attempt {attempt_num}/{total_attempts} returned cached sitemap ({cache_age_hours}h old) - using cache, refresh continues in background",
                     )
-                    continue
+                    sitemap_data = self.sitemap_scraper.parse_sitemap(xml_content)
+                    self._cached_sitemap_hash = hash(xml_content)
+                    return (sitemap_data, True, cache_age_hours)
 
                 # If no content, continue to next retry
                 logger.warning(
@@ -377,14 +639,11 @@ class MarketplaceScraper:
                 continue
 
         # All retry attempts failed - fall back to cache
-        total_wait = sum(retry_delays)
-        total_wait_minutes = round(total_wait / 60, 2)
         logger.warning(
             "sitemap_all_retries_failed",
             total_attempts=total_attempts,
-            total_wait_seconds=total_wait,
-            total_wait_minutes=total_wait_minutes,
-            message=f"All {total_attempts} retry attempts failed (waited {total_wait}s / {total_wait_minutes} minutes total) - falling back to cached sitemap",
+            total_wait_seconds=round(total_wait, 2),
+            message=f"All {total_attempts} retry attempts failed (waited {total_wait:.1f}s total) - falling back to cached sitemap",
         )
 
         # Try to get cached sitemap (this should work as get_sitemap falls back to cache)
@@ -414,6 +673,67 @@ class MarketplaceScraper:
         )
         raise ValueError("Failed to get sitemap after all retry attempts and cache fallback")
 
+    async def _get_sitemap_cached(
+        self, fetch: Callable[[], Awaitable[tuple[Dict[str, Any], bool, float]]]
+    ) -> tuple[Dict[str, Any], bool, float]:
+        """Get the parsed sitemap, fetching it at most once per scraper instance.
+
+        Later calls (e.g. scraping creators after products) reuse the first result, which
+        is replaced when a stale cached sitemap gets refreshed.
+
+        Args:
+            fetch: Coroutine function fetching and parsing the sitemap
+                (_get_sitemap_with_initial_retry or sitemap_scraper.scrape)
+
+        Returns:
+            Tuple of (parsed sitemap dict, cache_used, cache_age_hours)
+
+        Raises:
+            httpx.HTTPStatusError: If marketplace sitemap returns 5xx error
+        """
+        if self._sitemap_cache is not None:
+            return self._sitemap_cache
+
+        async with self.sitemap_scraper:
+            try:
+                self._sitemap_cache = await fetch()
+            except httpx.HTTPStatusError as e:
+                # If marketplace sitemap returns 5xx, abort scraper
+                if 500 <= e.response.status_code < 600:
+                    logger.error(
+                        "upstream_unavailable",
+                        url=str(e.request.url),
+                        status_code=e.response.status_code,
+                        message="Marketplace sitemap returned 5xx - aborting scraper",
+                    )
+                    self.metrics.stop()
+                    raise  # Propagate to main() for exit code handling
+                # Other HTTP errors - continue but log warning (not cached, so retried)
+                logger.warning(
+                    "sitemap_fetch_error",
+                    url=str(e.request.url),
+                    status_code=e.response.status_code,
+                )
+                return (
+                    {"products": {}, "categories": [], "profiles": [], "help_articles": []},
+                    False,
+                    0.0,
+                )
+
+        return self._sitemap_cache
+
+    async def _background_sitemap_refresh(self) -> None:
+        """Keep trying to fetch a fresh sitemap while scraping from the cached one.
+
+        Uses the same backoff as _get_sitemap_with_initial_retry() and stops after the
+        first fresh sitemap (new products are then scraped by _attempt_sitemap_refresh()).
+        """
+        for attempt_num in range(2, _SITEMAP_RETRY_ATTEMPTS + 1):
+            await asyncio.sleep(_sitemap_retry_delay(attempt_num))
+            if self.fresh_sitemap_obtained:
+                return
+            await self._attempt_sitemap_refresh(0.0)
+
     async def _scrape_new_products_background(self, new_urls: List[str]) -> None:
         """Scrape new products found during sitemap refresh in background.
 
@@ -429,23 +749,23 @@ class MarketplaceScraper:
             message=f"Scraping {len(new_urls)} new products found during sitemap refresh (background task)",
         )
 
-        # Scrape new URLs without refresh (to avoid infinite loop)
-        # Use same concurrency limit as main batch
-        limit = settings.max_concurrent_requests
-
-        # Create semaphore for concurrency control
-        semaphore = asyncio.Semaphore(limit)
-
-        async def scrape_with_semaphore(url: str):
-            async with semaphore:
-                return await self.scrape_product(url, skip_if_processed=True)
-
-        # Scrape new products
-        tasks = [scrape_with_semaphore(url) for url in new_urls]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Scrape new URLs without refresh (to avoid infinite loop); the checkpoint is
+        # saved once at the end instead of after every product
+        async def scrape_one(url: str, index: int, total: int):
+            return await self.scrape_product(
+                url, skip_if_processed=True, save_checkpoint_immediately=False
+            )
 
-        success_count = sum(1 for r in results if r and not isinstance(r, Exception))
+        # Shares the in-flight budget with the main batch (see _run_bounded); no progress
+        # bar, since the main batch's bar is still being drawn
+        success_count = await self._run_bounded(
+            new_urls, scrape_one, settings.max_concurrent_requests
+        )
         failed_count = len(new_urls) - success_count
+        if settings.checkpoint_enabled:
+            if self._write_queue is not None:
+                await self._write_queue.join()
+            await self._save_checkpoint()
 
         logger.info(
             "new_products_background_completed",
@@ -459,7 +779,7 @@ class MarketplaceScraper:
         """Attempt to refresh sitemap at milestone if stale cache was used.
 
         Args:
-            milestone: Progress milestone (0.25, 0.5, 0.75, 1.0)
+            milestone: Progress milestone (0.25, 0.5, 0.75, 1.0), or 0.0 for background retries
         """
         if not self.sitemap_scraper or not self.types_to_scrape:
             return
@@ -496,14 +816,30 @@ class MarketplaceScraper:
                         message=f"✅ Successfully refreshed sitemap at {milestone * 100:.0f}% - checking for new products. No further refresh attempts will be made.",
                     )
 
+                    # Same XML as the cache scraping started from (e.g. the server answered
+                    # 304): nothing new to find, so the parse and filter are skipped
+                    if hash(xml_content) == self._cached_sitemap_hash:
+                        logger.debug("sitemap_unchanged_skip_parse", milestone=milestone)
+                        if self._sitemap_cache is not None:
+                            self._sitemap_cache = (self._sitemap_cache[0], False, 0.0)
+                        return
+
                     # Parse fresh sitemap
                     fresh_sitemap_data = self.sitemap_scraper.parse_sitemap(xml_content)
+                    self._sitemap_cache = (fresh_sitemap_data, False, 0.0)
                     fresh_urls = self.sitemap_scraper.filter_urls_by_type(
                         fresh_sitemap_data, self.types_to_scrape
                     )
 
-                    # Find new URLs that weren't in original list
-                    new_urls = [url for url in fresh_urls if url not in self.seen_product_urls]
+                    # Find new URLs that weren't in original list (sitemap order kept, so
+                    # a plain set difference is not used; the sets are bound as locals)
+                    listed_urls = self.sitemap_product_urls
+                    seen_hashes = self.seen_product_url_hashes
+                    new_urls = [
+                        url
+                        for url in fresh_urls
+                        if url not in listed_urls and _product_url_key(url) not in seen_hashes
+                    ]
 
                     if new_urls:
                         logger.info(
@@ -513,7 +849,9 @@ class MarketplaceScraper:
                             message=f"Found {len(new_urls)} new products in refreshed sitemap - will be scraped immediately in background",
                         )
                         # Scrape new products immediately in background (non-blocking)
-                        asyncio.create_task(self._scrape_new_products_background(new_urls))
+                        task = asyncio.create_task(self._scrape_new_products_background(new_urls))
+                        self._background_scrapes.add(task)
+                        task.add_done_callback(self._background_scrapes.discard)
                     else:
                         logger.info(
                             "no_new_products_in_refresh",
@@ -560,11 +898,13 @@ class MarketplaceScraper:
         if limit is None:
             limit = settings.max_concurrent_requests
 
+        # Drop repeated URLs (keeps first-seen order) so no product is scraped twice
+        urls = list(dict.fromkeys(urls))
+
         # Filter out already processed URLs if checkpoint enabled
         if skip_processed and settings.checkpoint_enabled:
-            checkpoint = self.checkpoint_manager.load_checkpoint()
             original_count = len(urls)
-            urls = [url for url in urls if url not in checkpoint["processed_urls"]]
+            urls = self.checkpoint_manager.filter_unprocessed(urls)
             if original_count > len(urls):
                 logger.info(
                     "skipping_processed_urls",
@@ -578,86 +918,84 @@ class MarketplaceScraper:
 
         logger.info("starting_batch_scrape", total=len(urls), concurrency_limit=limit)
 
-        # Create semaphore for concurrency control
-        semaphore = asyncio.Semaphore(limit)
-
-        # Track milestones for sitemap refresh (only if used stale cache)
+        # Milestones for sitemap refresh (only if used stale cache)
         refresh_milestones = [0.25, 0.5, 0.75, 1.0] if used_stale_cache else []
-        refresh_attempted_at = set()
+        # Completed products; the event wakes the milestone coordinator after each one
+        completed_count = 0
+        progress_event = asyncio.Event()
 
-        # Batch checkpoint saving: save every 50 products for better performance
-        checkpoint_batch_size = 50
         last_checkpoint_save = 0
 
-        async def scrape_with_semaphore(url: str, index: int, total: int):
-            nonlocal last_checkpoint_save
-            async with semaphore:
-                current_progress = (index + 1) / total
-
-                # Log progress every 50 products or at milestones (10%, 25%, 50%, 75%, 90%)
-                if index % 50 == 0 or index in [
-                    int(total * 0.1),
-                    int(total * 0.25),
-                    int(total * 0.5),
-                    int(total * 0.75),
-                    int(total * 0.9),
-                ]:
-                    logger.info(
-                        "scraping_progress",
-                        current=index + 1,
-                        total=total,
-                        percentage=round(current_progress * 100, 2),
-                    )
-
-                # Attempt to refresh sitemap at milestones if used stale cache
+        async def refresh_at_milestones(total: int):
+            # Single coordinator: waits for each milestone, then refreshes outside the
+            # workers, so scraping tasks never check milestones themselves
+            for milestone in refresh_milestones:
+                while completed_count < milestone * total:
+                    progress_event.clear()
+                    await progress_event.wait()
                 # Skip if we already have fresh sitemap (optimization)
-                if used_stale_cache and refresh_milestones and not self.fresh_sitemap_obtained:
-                    for milestone in refresh_milestones:
-                        if current_progress >= milestone and milestone not in refresh_attempted_at:
-                            refresh_attempted_at.add(milestone)
-                            await self._attempt_sitemap_refresh(milestone)
-
-                # Use batch checkpoint saving for better performance
-                result = await self.scrape_product(
-                    url,
-                    skip_if_processed=skip_processed,
-                    save_checkpoint_immediately=False,
-                )
+                if self.fresh_sitemap_obtained:
+                    return
+                await self._attempt_sitemap_refresh(milestone)
 
-                # Save checkpoint periodically (every 50 products) for resume capability
-                if (
-                    settings.checkpoint_enabled
-                    and (index + 1) - last_checkpoint_save >= checkpoint_batch_size
-                ):
-                    checkpoint = self.checkpoint_manager.load_checkpoint()
-                    self.checkpoint_manager.save_checkpoint(
-                        checkpoint["processed_urls"],
-                        checkpoint["failed_urls"],
-                        self.stats,
-                    )
-                    last_checkpoint_save = index + 1
-                    logger.debug(
-                        "checkpoint_saved_batch",
-                        processed_count=len(checkpoint["processed_urls"]),
-                        index=index + 1,
-                    )
+        # Indices logged in addition to every 50th product (10%, 25%, 50%, 75%, 90%)
+        progress_log_indices = frozenset(
+            int(len(urls) * fraction) for fraction in (0.1, 0.25, 0.5, 0.75, 0.9)
+        )
+
+        async def scrape_one(url: str, index: int, total: int):
+            nonlocal completed_count, last_checkpoint_save
+
+            # Log progress every 50 products or at milestones (10%, 25%, 50%, 75%, 90%)
+            if index % 50 == 0 or index in progress_log_indices:
+                logger.info(
+                    "scraping_progress",
+                    current=index + 1,
+                    total=total,
+                    percentage=round((index + 1) / total * 100, 2),
+                )
 
-                return result
+            # Use batch checkpoint saving for better performance
+            result = await self.scrape_product(
+                url,
+                # Already filtered against the checkpoint above
+                skip_if_processed=False,
+                save_checkpoint_immediately=False,
+            )
+            completed_count += 1
+            progress_event.set()
+
+            # Save checkpoint periodically (every 50 products) for resume capability
+            if (
+                settings.checkpoint_enabled
+                and (index + 1) - last_checkpoint_save >= _CHECKPOINT_BATCH_SIZE
+            ):
+                last_checkpoint_save = index + 1
+                await self._save_checkpoint()
+                logger.debug("checkpoint_saved_batch", index=index + 1)
+            return result
+
+        # Attempt to refresh sitemap at milestones if used stale cache
+        refresher = (
+            asyncio.create_task(refresh_at_milestones(len(urls))) if refresh_milestones else None
+        )
 
         # Scrape with progress bar
-        tasks = [scrape_with_semaphore(url, i, len(urls)) for i, url in enumerate(urls)]
-        results = await tqdm.gather(*tasks, desc="Scraping products")
+        try:
+            success_count = await self._run_bounded(urls, scrape_one, limit, "Scraping products")
+            if refresher:
+                # Let the final (100%) refresh run before returning
+                await refresher
+        finally:
+            if refresher and not refresher.done():
+                refresher.cancel()
 
-        success_count = sum(1 for r in results if r)
+        # Let the background writers save the remaining products first
+        await self.flush_writes()
 
         # Save final checkpoint with stats
         if settings.checkpoint_enabled:
-            checkpoint = self.checkpoint_manager.load_checkpoint()
-            self.checkpoint_manager.save_checkpoint(
-                checkpoint["processed_urls"],
-                checkpoint["failed_urls"],
-                self.stats,
-            )
+            await self._save_checkpoint()
 
         logger.info(
             "batch_scrape_completed",
@@ -666,6 +1004,67 @@ class MarketplaceScraper:
             failed=len(urls) - success_count,
         )
 
+    async def _run_bounded(
+        self,
+        urls: List[str],
+        scrape_one: Callable[[str, int, int], Awaitable[bool]],
+        limit: int,
+        desc: Optional[str] = None,
+    ) -> int:
+        """Run scrape_one over urls with a fixed pool of `limit` workers.
+
+        Workers pull from one shared iterator, so only `limit` coroutines exist at a time
+        (instead of one per URL) and results are counted as they complete. Batches running
+        at the same time share one budget of in-flight scrapes: the largest of
+        settings.max_concurrent_requests and any `limit` requested so far. With adaptive
+        concurrency enabled, the admission controller sets it instead.
+
+        Args:
+            urls: URLs to scrape
+            scrape_one: Coroutine function called with (url, index, total)
+            limit: Number of concurrent workers
+            desc: Progress bar description (no progress bar if None)
+
+        Returns:
+            Number of URLs scraped successfully
+        """
+        total = len(urls)
+        pending = enumerate(urls)
+        success_count = 0
+        admission = self.admission
+        slots = self._scrape_slots
+        if admission is None and limit > self._scrape_slot_count:
+            # Grow the shared budget so a larger requested limit is not silently capped
+            for _ in range(limit - self._scrape_slot_count):
+                slots.release()
+            logger.info(
+                "scrape_budget_raised", previous=self._scrape_slot_count, concurrency_limit=limit
+            )
+            self._scrape_slot_count = limit
+
+        async def worker():
+            nonlocal success_count
+            for index, url in pending:
+                if admission is None:
+                    async with slots:
+                        result = await scrape_one(url, index, total)
+                else:
+                    result = await admission.run(scrape_one, url, index, total)
+                success_count += bool(result)
+                progress_bar.update(1)
+
+        # disable=None turns the bar off when stderr is not a terminal (e.g. redirected to a
+        # log file); progress is logged by the batch scrapers either way
+        progress_bar = tqdm(total=total, desc=desc, disable=True if desc is None else None)
+        try:
+            # A task group cancels the remaining workers if one of them fails
+            async with asyncio.TaskGroup() as workers:
+                for _ in range(min(limit, total)):
+                    workers.create_task(worker())
+        finally:
+            progress_bar.close()
+        return success_count
+
     async def scrape(
         self,
         limit: Optional[int] = None,
@@ -685,9 +1084,6 @@ class MarketplaceScraper:
         Raises:
             TimeoutError: If global scraping timeout is exceeded
         """
-        import asyncio
-        import time
-
         # Start metrics tracking
         self.metrics.start()
         start_time = time.time()
@@ -705,45 +1101,15 @@ class MarketplaceScraper:
                 )
 
         # Get product URLs from sitemap with initial retry attempts
-        async with self.sitemap_scraper:
-            try:
-                (
-                    sitemap_data,
-                    cache_used,
-                    cache_age_hours,
-                ) = await self._get_sitemap_with_initial_retry()
-            except httpx.HTTPStatusError as e:
-                # If marketplace sitemap returns 5xx, abort scraper
-                if 500 <= e.response.status_code < 600:
-                    logger.error(
-                        "upstream_unavailable",
-                        url=str(e.request.url),
-                        status_code=e.response.status_code,
-                        message="Marketplace sitemap returned 5xx - aborting scraper",
-                    )
-                    self.metrics.stop()
-                    raise  # Propagate to main() for exit code handling
-                else:
-                    # Other HTTP errors - continue but log warning
-                    logger.warning(
-                        "sitemap_fetch_error",
-                        url=str(e.request.url),
-                        status_code=e.response.status_code,
-                    )
-                    sitemap_data = {
-                        "products": {},
-                        "categories": [],
-                        "profiles": [],
-                        "help_articles": [],
-                    }
-                    cache_used = False
-                    cache_age_hours = 0.0
-
-            # Use provided product types or fall back to settings
-            types_to_scrape = (
-                product_types if product_types is not None else settings.get_product_types()
-            )
-            product_urls = self.sitemap_scraper.filter_urls_by_type(sitemap_data, types_to_scrape)
+        sitemap_data, cache_used, cache_age_hours = await self._get_sitemap_cached(
+            self._get_sitemap_with_initial_retry
+        )
+
+        # Use provided product types or fall back to settings
+        types_to_scrape = (
+            product_types if product_types is not None else settings.get_product_types()
+        )
+        product_urls = self.sitemap_scraper.filter_urls_by_type(sitemap_data, types_to_scrape)
 
         if not product_urls:
             logger.warning("no_products_found")
@@ -769,14 +1135,17 @@ class MarketplaceScraper:
             product_urls = product_urls[:limit]
             logger.info("applying_limit", limit=limit, remaining=len(product_urls))
 
-        # Store types for potential sitemap refresh
+        # Store types and the URL list for potential sitemap refresh
         self.types_to_scrape = types_to_scrape
+        self.sitemap_product_urls = set(product_urls)
 
         # Determine if we used stale cache (cache_used and cache_age > 6h)
         used_stale_cache = cache_used and cache_age_hours > 6.0
-        if used_stale_cache:
-            # Reset flags for this scraping session
+        if cache_used:
+            # Keep retrying for a fresh sitemap in background while scraping from the cache
             self.fresh_sitemap_obtained = False
+            self._sitemap_refresh_task = asyncio.create_task(self._background_sitemap_refresh())
+        if used_stale_cache:
             logger.info(
                 "stale_cache_detected",
                 cache_age_hours=cache_age_hours,
@@ -852,12 +1221,18 @@ class MarketplaceScraper:
 
         return self.stats
 
-    async def scrape_creator(self, url: str, skip_if_processed: bool = True) -> bool:
+    async def scrape_creator(
+        self,
+        url: str,
+        skip_if_processed: bool = True,
+        save_checkpoint_immediately: bool = True,
+    ) -> bool:
         """Scrape a single creator profile.
 
         Args:
             url: Creator profile URL
             skip_if_processed: Skip if already processed (checkpoint)
+            save_checkpoint_immediately: If False, checkpoint is saved in batch (for performance)
 
         Returns:
             True if successful, False otherwise
@@ -872,54 +1247,50 @@ class MarketplaceScraper:
             # Scrape creator profile
             creator_data = await self.creator_scraper.scrape(url)
             if not creator_data:
-                self.stats["creators_failed"] += 1
-                self.metrics.record_product_failed(url=url)  # Reuse metrics for now
-                if settings.checkpoint_enabled:
-                    self.checkpoint_manager.add_failed(url)
+                self._record_entity_failed("creators_failed", url, save_checkpoint_immediately)
                 return False
 
-            # Parse creator HTML
-            creator = self.creator_parser.parse(creator_data["html"], creator_data["url"])
+            # Parse creator HTML (in a worker thread, like product pages)
+            creator = await asyncio.to_thread(
+                self.creator_parser.parse, creator_data["html"], creator_data["url"]
+            )
             if not creator:
-                self.stats["creators_failed"] += 1
-                self.metrics.record_product_failed(url=url)
-                if settings.checkpoint_enabled:
-                    self.checkpoint_manager.add_failed(url)
+                self._record_entity_failed("creators_failed", url, save_checkpoint_immediately)
                 return False
 
-            # Deduplication check for creators
-            is_duplicate_creator = False
-            if creator.username in self.seen_creator_ids:
+            # Deduplication check for creators: a duplicate was already saved under the
+            # same username, so both the JSON and the DB write are skipped
+            username_hash = hash(creator.username)
+            if username_hash in self.seen_creator_id_hashes:
                 logger.warning("duplicate_creator_id", username=creator.username, url=url)
-                is_duplicate_creator = True
-            else:
-                self.seen_creator_ids.add(creator.username)
-
-            # Save creator
-            success = await self.storage.save_creator_json(creator)
+                self._record_entity_scraped("creators_scraped", url, save_checkpoint_immediately)
+                return True
+            self.seen_creator_id_hashes.add(username_hash)
 
-            # Save creator to database only if not duplicate
-            if not is_duplicate_creator:
-                await self.db_storage.save_creator_db(creator)
+            if save_checkpoint_immediately:
+                # Save creator as JSON and to database (independent, so issued together)
+                success, _ = await asyncio.gather(
+                    self.storage.save_creator_json(creator),
+                    asyncio.to_thread(self.db_storage.save_creator_db_sync, creator),
+                )
             else:
-                logger.warning("db_write_skipped_duplicate_creator", username=creator.username)
+                # Batch mode: bulk-inserted with the buffer before the next checkpoint save,
+                # buffered right before the checkpoint update (as in _save_product)
+                success = await self.storage.save_creator_json(creator)
+                self._creator_db_buffer.append((url, creator))
 
             if success:
-                self.stats["creators_scraped"] += 1
-                self.metrics.record_product_scraped()  # Reuse metrics for now
-                if settings.checkpoint_enabled:
-                    self.checkpoint_manager.add_processed(url)
+                self._record_entity_scraped("creators_scraped", url, save_checkpoint_immediately)
                 logger.info(
                     "creator_scraped",
                     username=creator.username,
                     name=creator.name,
                 )
             else:
-                self.stats["creators_failed"] += 1
-                self.metrics.record_product_failed(url=url)
-                if settings.checkpoint_enabled:
-                    self.checkpoint_manager.add_failed(url)
+                self._record_entity_failed("creators_failed", url, save_checkpoint_immediately)
 
+            if len(self._creator_db_buffer) >= _DB_BATCH_SIZE:
+                await self._flush_creator_db_buffer()
             return success
 
         except Exception as e:
@@ -930,12 +1301,46 @@ class MarketplaceScraper:
                 error=str(e),
                 error_type=error_type,
             )
-            self.stats["creators_failed"] += 1
-            self.metrics.record_product_failed(error_type=error_type, url=url)
-            if settings.checkpoint_enabled:
-                self.checkpoint_manager.add_failed(url)
+            self._record_entity_failed(
+                "creators_failed", url, save_checkpoint_immediately, error_type=error_type
+            )
             return False
 
+    def _record_entity_scraped(
+        self, stats_key: str, url: str, save_checkpoint_immediately: bool
+    ) -> None:
+        """Count a scraped creator/category and mark its URL as processed.
+
+        Args:
+            stats_key: Stats counter to increment (e.g. "creators_scraped")
+            url: Scraped URL
+            save_checkpoint_immediately: If False, checkpoint is saved in batch (for performance)
+        """
+        self.stats[stats_key] += 1
+        self.metrics.record_product_scraped()  # Reuse metrics for now
+        if settings.checkpoint_enabled:
+            self.checkpoint_manager.add_processed(url, save_immediately=save_checkpoint_immediately)
+
+    def _record_entity_failed(
+        self,
+        stats_key: str,
+        url: str,
+        save_checkpoint_immediately: bool,
+        error_type: Optional[str] = None,
+    ) -> None:
+        """Count a failed creator/category and mark its URL as failed.
+
+        Args:
+            stats_key: Stats counter to increment (e.g. "creators_failed")
+            url: URL that failed
+            save_checkpoint_immediately: If False, checkpoint is saved in batch (for performance)
+            error_type: Exception type name, if the failure was an exception
+        """
+        self.stats[stats_key] += 1
+        self.metrics.record_product_failed(error_type=error_type, url=url)
+        if settings.checkpoint_enabled:
+            self.checkpoint_manager.add_failed(url, save_immediately=save_checkpoint_immediately)
+
     async def scrape_creators_batch(
         self, urls: List[str], limit: Optional[int] = None, skip_processed: bool = True
     ) -> None:
@@ -951,9 +1356,8 @@ class MarketplaceScraper:
 
         # Filter out already processed URLs if checkpoint enabled
         if skip_processed and settings.checkpoint_enabled:
-            checkpoint = self.checkpoint_manager.load_checkpoint()
             original_count = len(urls)
-            urls = [url for url in urls if url not in checkpoint["processed_urls"]]
+            urls = self.checkpoint_manager.filter_unprocessed(urls)
             if original_count > len(urls):
                 logger.info(
                     "skipping_processed_urls",
@@ -967,42 +1371,47 @@ class MarketplaceScraper:
 
         logger.info("starting_creators_batch_scrape", total=len(urls), concurrency_limit=limit)
 
-        # Create semaphore for concurrency control
-        semaphore = asyncio.Semaphore(limit)
-
-        async def scrape_with_semaphore(url: str, index: int, total: int):
-            async with semaphore:
-                # Log progress every 50 creators or at milestones
-                if index % 50 == 0 or index in [
-                    int(total * 0.1),
-                    int(total * 0.25),
-                    int(total * 0.5),
-                    int(total * 0.75),
-                    int(total * 0.9),
-                ]:
-                    logger.info(
-                        "scraping_creators_progress",
-                        current=index + 1,
-                        total=total,
-                        percentage=round((index + 1) / total * 100, 2),
-                    )
-                return await self.scrape_creator(url, skip_if_processed=skip_processed)
+        # Indices logged in addition to every 50th creator (10%, 25%, 50%, 75%, 90%)
+        progress_log_indices = frozenset(
+            int(len(urls) * fraction) for fraction in (0.1, 0.25, 0.5, 0.75, 0.9)
+        )
 
-        # Scrape with progress bar
-        tasks = [scrape_with_semaphore(url, i, len(urls)) for i, url in enumerate(urls)]
-        results = await tqdm.gather(*tasks, desc="Scraping creators")
+        last_checkpoint_save = 0
 
-        success_count = sum(1 for r in results if r)
+        async def scrape_one(url: str, index: int, total: int):
+            nonlocal last_checkpoint_save
 
-        # Save final checkpoint with stats
-        if settings.checkpoint_enabled:
-            checkpoint = self.checkpoint_manager.load_checkpoint()
-            self.checkpoint_manager.save_checkpoint(
-                checkpoint["processed_urls"],
-                checkpoint["failed_urls"],
-                self.stats,
+            # Log progress every 50 creators or at milestones
+            if index % 50 == 0 or index in progress_log_indices:
+                logger.info(
+                    "scraping_creators_progress",
+                    current=index + 1,
+                    total=total,
+                    percentage=round((index + 1) / total * 100, 2),
+                )
+            # Already filtered against the checkpoint above; saved in batches below
+            result = await self.scrape_creator(
+                url, skip_if_processed=False, save_checkpoint_immediately=False
             )
 
+            # Save checkpoint periodically (every 50 creators) for resume capability
+            if (
+                settings.checkpoint_enabled
+                and (index + 1) - last_checkpoint_save >= _CHECKPOINT_BATCH_SIZE
+            ):
+                last_checkpoint_save = index + 1
+                await self._save_checkpoint()
+            return result
+
+        # Scrape with progress bar
+        success_count = await self._run_bounded(urls, scrape_one, limit, "Scraping creators")
+
+        # Save final checkpoint with stats (buffered creators are stored first)
+        if settings.checkpoint_enabled:
+            await self._save_checkpoint()
+        else:
+            await self._flush_creator_db_buffer()
+
         logger.info(
             "creators_batch_scrape_completed",
             total=len(urls),
@@ -1036,34 +1445,8 @@ class MarketplaceScraper:
                 )
 
         # Get creator profile URLs from sitemap
-        async with self.sitemap_scraper:
-            try:
-                sitemap_data, _, _ = await self.sitemap_scraper.scrape()
-            except httpx.HTTPStatusError as e:
-                # If marketplace sitemap returns 5xx, abort scraper
-                if 500 <= e.response.status_code < 600:
-                    logger.error(
-                        "upstream_unavailable",
-                        url=str(e.request.url),
-                        status_code=e.response.status_code,
-                        message="Marketplace sitemap returned 5xx - aborting scraper",
-                    )
-                    self.metrics.stop()
-                    raise  # Propagate to main() for exit code handling
-                else:
-                    # Other HTTP errors - continue but log warning
-                    logger.warning(
-                        "sitemap_fetch_error",
-                        url=str(e.request.url),
-                        status_code=e.response.status_code,
-                    )
-                    sitemap_data = {
-                        "products": {},
-                        "categories": [],
-                        "profiles": [],
-                        "help_articles": [],
-                    }
-            creator_urls = sitemap_data.get("profiles", [])
+        sitemap_data, _, _ = await self._get_sitemap_cached(self.sitemap_scraper.scrape)
+        creator_urls = sitemap_data.get("profiles", [])
 
         if not creator_urls:
             logger.warning("no_creators_found")
@@ -1099,12 +1482,18 @@ class MarketplaceScraper:
 
         return self.stats
 
-    async def scrape_category(self, url: str, skip_if_processed: bool = True) -> bool:
+    async def scrape_category(
+        self,
+        url: str,
+        skip_if_processed: bool = True,
+        save_checkpoint_immediately: bool = True,
+    ) -> bool:
         """Scrape a single category page.
 
         Args:
             url: Category URL
             skip_if_processed: Skip if already processed (checkpoint)
+            save_checkpoint_immediately: If False, checkpoint is saved in batch (for performance)
 
         Returns:
             True if successful, False otherwise
@@ -1119,40 +1508,29 @@ class MarketplaceScraper:
             # Scrape category page
             html = await self.category_scraper.scrape_category(url)
             if not html:
-                self.stats["categories_failed"] += 1
-                self.metrics.record_product_failed(url=url)  # Reuse metrics for now
-                if settings.checkpoint_enabled:
-                    self.checkpoint_manager.add_failed(url)
+                self._record_entity_failed("categories_failed", url, save_checkpoint_immediately)
                 return False
 
-            # Parse category HTML
-            category = self.category_parser.parse(html, url)
+            # Parse category HTML (in a worker thread, like product pages)
+            category = await asyncio.to_thread(self.category_parser.parse, html, url)
             if not category:
-                self.stats["categories_failed"] += 1
-                self.metrics.record_product_failed(url=url)
-                if settings.checkpoint_enabled:
-                    self.checkpoint_manager.add_failed(url)
+                self._record_entity_failed("categories_failed", url, save_checkpoint_immediately)
                 return False
 
-            # Save category
-            success = await self.storage.save_category_json(category)
-            # Save category to database
-            await self.db_storage.save_category_db(category)
+            # Save category as JSON and to database (independent, so issued together)
+            success, _ = await asyncio.gather(
+                self.storage.save_category_json(category),
+                asyncio.to_thread(self.db_storage.save_category_db_sync, category),
+            )
             if success:
-                self.stats["categories_scraped"] += 1
-                self.metrics.record_product_scraped()  # Reuse metrics for now
-                if settings.checkpoint_enabled:
-                    self.checkpoint_manager.add_processed(url)
+                self._record_entity_scraped("categories_scraped", url, save_checkpoint_immediately)
                 logger.info(
                     "category_scraped",
                     slug=category.slug,
                     name=category.name,
                 )
             else:
-                self.stats["categories_failed"] += 1
-                self.metrics.record_product_failed(url=url)
-                if settings.checkpoint_enabled:
-                    self.checkpoint_manager.add_failed(url)
+                self._record_entity_failed("categories_failed", url, save_checkpoint_immediately)
 
             return success
 
@@ -1164,10 +1542,9 @@ class MarketplaceScraper:
                 error=str(e),
                 error_type=error_type,
             )
-            self.stats["categories_failed"] += 1
-            self.metrics.record_product_failed(error_type=error_type, url=url)
-            if settings.checkpoint_enabled:
-                self.checkpoint_manager.add_failed(url)
+            self._record_entity_failed(
+                "categories_failed", url, save_checkpoint_immediately, error_type=error_type
+            )
             return False
 
     async def scrape_categories_batch(
@@ -1185,9 +1562,8 @@ class MarketplaceScraper:
 
         # Filter out already processed URLs if checkpoint enabled
         if skip_processed and settings.checkpoint_enabled:
-            checkpoint = self.checkpoint_manager.load_checkpoint()
             original_count = len(urls)
-            urls = [url for url in urls if url not in checkpoint["processed_urls"]]
+            urls = self.checkpoint_manager.filter_unprocessed(urls)
             if original_count > len(urls):
                 logger.info(
                     "skipping_processed_urls",
@@ -1201,41 +1577,45 @@ class MarketplaceScraper:
 
         logger.info("starting_categories_batch_scrape", total=len(urls), concurrency_limit=limit)
 
-        # Create semaphore for concurrency control
-        semaphore = asyncio.Semaphore(limit)
-
-        async def scrape_with_semaphore(url: str, index: int, total: int):
-            async with semaphore:
-                # Log progress every 50 categories or at milestones
-                if index % 50 == 0 or index in [
-                    int(total * 0.1),
-                    int(total * 0.25),
-                    int(total * 0.5),
-                    int(total * 0.75),
-                    int(total * 0.9),
-                ]:
-                    logger.info(
-                        "scraping_categories_progress",
-                        current=index + 1,
-                        total=total,
-                        percentage=round((index + 1) / total * 100, 2),
-                    )
-                return await self.scrape_category(url, skip_if_processed=skip_processed)
+        # Indices logged in addition to every 50th category (10%, 25%, 50%, 75%, 90%)
+        progress_log_indices = frozenset(
+            int(len(urls) * fraction) for fraction in (0.1, 0.25, 0.5, 0.75, 0.9)
+        )
 
-        # Scrape with progress bar
-        tasks = [scrape_with_semaphore(url, i, len(urls)) for i, url in enumerate(urls)]
-        results = await tqdm.gather(*tasks, desc="Scraping categories")
+        last_checkpoint_save = 0
 
-        success_count = sum(1 for r in results if r)
+        async def scrape_one(url: str, index: int, total: int):
+            nonlocal last_checkpoint_save
+
+            # Log progress every 50 categories or at milestones
+            if index % 50 == 0 or index in progress_log_indices:
+                logger.info(
+                    "scraping_categories_progress",
+                    current=index + 1,
+                    total=total,
+                    percentage=round((index + 1) / total * 100, 2),
+                )
+            # Already filtered against the checkpoint above; saved in batches below
+            result = await self.scrape_category(
+                url, skip_if_processed=False, save_checkpoint_immediately=False
+            )
+
+            # Save checkpoint periodically (every 50 categories) for resume capability
+            if (
+                settings.checkpoint_enabled
+                and (index + 1) - last_checkpoint_save >= _CHECKPOINT_BATCH_SIZE
+            ):
+                last_checkpoint_save = index + 1
+                await self.checkpoint_manager.flush_async(self.stats)
+            return result
+
+        # Scrape with progress bar
+        success_count = await self._run_bounded(urls, scrape_one, limit, "Scraping categories")
+        await self.category_scraper.save_cache_index()
 
         # Save final checkpoint with stats
         if settings.checkpoint_enabled:
-            checkpoint = self.checkpoint_manager.load_checkpoint()
-            self.checkpoint_manager.save_checkpoint(
-                checkpoint["processed_urls"],
-                checkpoint["failed_urls"],
-                self.stats,
-            )
+            await self.checkpoint_manager.flush_async(self.stats)
 
         logger.info(
             "categories_batch_scrape_completed",
@@ -1272,34 +1652,8 @@ class MarketplaceScraper:
                 )
 
         # Get category URLs from sitemap
-        async with self.sitemap_scraper:
-            try:
-                sitemap_data, _, _ = await self.sitemap_scraper.scrape()
-            except httpx.HTTPStatusError as e:
-                # If marketplace sitemap returns 5xx, abort scraper
-                if 500 <= e.response.status_code < 600:
-                    logger.error(
-                        "upstream_unavailable",
-                        url=str(e.request.url),
-                        status_code=e.response.status_code,
-                        message="Marketplace sitemap returned 5xx - aborting scraper",
-                    )
-                    self.metrics.stop()
-                    raise  # Propagate to main() for exit code handling
-                else:
-                    # Other HTTP errors - continue but log warning
-                    logger.warning(
-                        "sitemap_fetch_error",
-                        url=str(e.request.url),
-                        status_code=e.response.status_code,
-                    )
-                    sitemap_data = {
-                        "products": {},
-                        "categories": [],
-                        "profiles": [],
-                        "help_articles": [],
-                    }
-            category_urls = sitemap_data.get("categories", [])
+        sitemap_data, _, _ = await self._get_sitemap_cached(self.sitemap_scraper.scrape)
+        category_urls = sitemap_data.get("categories", [])
 
         if not category_urls:
             logger.warning("no_categories_found")
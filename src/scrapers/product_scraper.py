@@ -1,5 +1,6 @@
 """Product scraper for fetching individual product pages."""
 
+import time
 from typing import Optional
 from urllib.parse import urlparse
 
@@ -96,8 +97,6 @@ class ProductScraper:
         Returns:
             HTML content or None if failed
         """
-        import time
-
         try:
             # Rate limiting
             await self.rate_limiter.acquire()
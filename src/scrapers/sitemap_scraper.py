@@ -1,19 +1,30 @@
 """Sitemap scraper for extracting product URLs from sitemap.xml."""
 
+import asyncio
+import io
+import json
+import os
+import random
 import time
 import xml.etree.ElementTree as ET
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 import httpx
 
 from src.config.settings import settings
 from src.utils.logger import get_logger
+from src.utils.retry import retry_async
 from src.utils.user_agents import get_random_user_agent
 
 logger = get_logger(__name__)
 
+# Sitemap element tags (ElementTree "{namespace}tag" form)
+_SITEMAP_NS = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+_URL_TAG = f"{_SITEMAP_NS}url"
+_LOC_TAG = f"{_SITEMAP_NS}loc"
+
 
 class SitemapScraper:
     """Scraper for sitemap.xml files."""
@@ -26,6 +37,9 @@ class SitemapScraper:
         """
         self.client = client
         self._should_close_client = client is None
+        # Validators of the last marketplace sitemap response, and whether it was a 304
+        self._last_validators: Dict[str, Optional[str]] = {}
+        self._last_not_modified = False
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -77,19 +91,34 @@ class SitemapScraper:
         Raises:
             httpx.HTTPStatusError: If marketplace sitemap returns 5xx error (after retries)
         """
-        from src.utils.retry import retry_async
 
         async def _fetch():
             logger.info("fetching_sitemap", url=url)
             # Add small random delay before request to avoid hitting rate limits
-            import asyncio
-            import random
-
             await asyncio.sleep(random.uniform(0.5, 1.5))
 
-            response = await self.client.get(url)
+            # Revalidate the cached marketplace sitemap instead of downloading it again
+            is_marketplace_sitemap = url == settings.sitemap_url
+            validators = self._get_cache_validators() if is_marketplace_sitemap else {}
+            response = await self.client.get(url, headers=validators)
+
+            # 304 Not Modified: the cached copy is current, even if past its max age
+            if response.status_code == 304:
+                cached_content = self._read_cached_sitemap()
+                if cached_content is not None:
+                    self._last_not_modified = True
+                    logger.info("sitemap_not_modified", url=url, size=len(cached_content))
+                    return cached_content
+                response = await self.client.get(url)
             response.raise_for_status()
 
+            if is_marketplace_sitemap:
+                self._last_not_modified = False
+                self._last_validators = {
+                    "etag": response.headers.get("etag"),
+                    "last_modified": response.headers.get("last-modified"),
+                }
+
             # Get content - httpx should auto-decompress, but verify
             content = response.content
 
@@ -163,6 +192,51 @@ class SitemapScraper:
             logger.error("sitemap_fetch_error", url=url, error=str(e))
             return None
 
+    @staticmethod
+    def _validators_path() -> Path:
+        """Get Path of the file holding the cached sitemap's ETag / Last-Modified."""
+        return Path(settings.sitemap_cache_file).with_suffix(".validators.json")
+
+    def _get_cache_validators(self) -> Dict[str, str]:
+        """Build conditional request headers from the cached sitemap's validators.
+
+        Returns:
+            Dict with If-None-Match / If-Modified-Since headers (empty if not cached)
+        """
+        if not settings.sitemap_cache_enabled:
+            return {}
+
+        validators_path = self._validators_path()
+        if not validators_path.exists() or not Path(settings.sitemap_cache_file).exists():
+            return {}
+
+        try:
+            with open(validators_path, "r", encoding="utf-8") as f:
+                validators = json.load(f)
+        except Exception as e:
+            logger.warning("sitemap_cache_validators_load_error", error=str(e))
+            return {}
+
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        return headers
+
+    def _read_cached_sitemap(self) -> Optional[bytes]:
+        """Read the cached sitemap regardless of its age.
+
+        Returns:
+            Cached sitemap content or None if missing
+        """
+        try:
+            with open(settings.sitemap_cache_file, "rb") as f:
+                return f.read()
+        except Exception as e:
+            logger.warning("sitemap_cache_load_error", error=str(e))
+            return None
+
     def _load_cached_sitemap(self, extended_max_age: bool = False) -> Optional[bytes]:
         """Load cached sitemap if available and not expired.
 
@@ -224,10 +298,20 @@ class SitemapScraper:
             cache_path.parent.mkdir(parents=True, exist_ok=True)
             with open(cache_path, "wb") as f:
                 f.write(content)
+            # Keep the validators next to the cache so the next run can revalidate it
+            with open(self._validators_path(), "w", encoding="utf-8") as f:
+                json.dump(self._last_validators, f, indent=2)
             logger.info("sitemap_cache_saved", path=str(cache_path), size=len(content))
         except Exception as e:
             logger.warning("sitemap_cache_save_error", error=str(e))
 
+    def _touch_cached_sitemap(self) -> None:
+        """Reset the cache age after the server confirmed the cached sitemap (304)."""
+        try:
+            os.utime(settings.sitemap_cache_file)
+        except Exception as e:
+            logger.warning("sitemap_cache_save_error", error=str(e))
+
     async def get_sitemap(self) -> tuple[Optional[bytes], bool, float]:
         """Get marketplace sitemap with cache support.
 
@@ -249,8 +333,11 @@ class SitemapScraper:
         try:
             content = await self.fetch_sitemap(settings.sitemap_url)
             if content:
-                # Save to cache on success
-                self._save_cached_sitemap(content)
+                # Save to cache on success (a 304 only needs the cache age reset)
+                if self._last_not_modified:
+                    self._touch_cached_sitemap()
+                else:
+                    self._save_cached_sitemap(content)
                 logger.info(
                     "sitemap_fetched_fresh",
                     message="✅ Fresh sitemap fetched successfully - all products will be detected",
@@ -342,6 +429,34 @@ class SitemapScraper:
         logger.error("marketplace_sitemap_failed_no_cache", url=settings.sitemap_url)
         return (None, False, 0.0)
 
+    @staticmethod
+    def _iter_sitemap_urls(xml_content: bytes) -> Iterator[str]:
+        """Stream <loc> URLs out of sitemap XML.
+
+        Each <url> element is read once and then dropped from the root, so memory
+        stays flat instead of growing with the whole document tree.
+
+        Args:
+            xml_content: Sitemap XML content
+
+        Yields:
+            Non-empty <loc> values in document order
+
+        Raises:
+            ET.ParseError: If the XML is malformed
+        """
+        events = ET.iterparse(io.BytesIO(xml_content), events=("start", "end"))
+        _, root = next(events)
+        for event, url_elem in events:
+            if event != "end" or url_elem.tag != _URL_TAG:
+                continue
+
+            loc_elem = url_elem.find(_LOC_TAG)
+            url = loc_elem.text if loc_elem is not None else None
+            root.clear()
+            if url:
+                yield url
+
     def parse_sitemap(self, xml_content: bytes) -> Dict[str, List[str]]:
         """Parse sitemap XML and extract URLs by type.
 
@@ -367,24 +482,20 @@ class SitemapScraper:
             if isinstance(xml_content, str):
                 xml_content = xml_content.encode("utf-8")
 
-            # Try to decode and re-encode to ensure proper encoding
+            # Parse the bytes as-is (the XML parser validates UTF-8 and skips a BOM), so
+            # the sitemap is not copied; only content that is not valid UTF-8 is
+            # re-encoded from latin-1 (more permissive) and parsed again
             try:
-                # First try UTF-8
-                decoded = xml_content.decode("utf-8")
-            except UnicodeDecodeError:
-                # Fallback to latin-1 (more permissive)
-                logger.warning("sitemap_encoding_fallback", encoding="latin-1")
-                decoded = xml_content.decode("latin-1", errors="replace")
-
-            # Remove BOM if present
-            if decoded.startswith("\ufeff"):
-                decoded = decoded[1:]
-
-            # Re-encode to UTF-8 for parsing
-            xml_content = decoded.encode("utf-8")
-
-            root = ET.fromstring(xml_content)
-            namespace = {"sitemap": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+                urls = list(self._iter_sitemap_urls(xml_content))
+            except ET.ParseError:
+                try:
+                    xml_content.decode("utf-8")
+                except UnicodeDecodeError:
+                    logger.warning("sitemap_encoding_fallback", encoding="latin-1")
+                    xml_content = xml_content.decode("latin-1", errors="replace").encode("utf-8")
+                    urls = list(self._iter_sitemap_urls(xml_content))
+                else:
+                    raise
 
             result: Dict[str, any] = {
                 "products": defaultdict(list),
@@ -393,15 +504,7 @@ class SitemapScraper:
                 "help_articles": [],
             }
 
-            for url_elem in root.findall(".//sitemap:url", namespace):
-                loc_elem = url_elem.find("sitemap:loc", namespace)
-                if loc_elem is None:
-                    continue
-
-                url = loc_elem.text
-                if not url:
-                    continue
-
+            for url in urls:
                 # Profile użytkowników (wszystko zaczynające się od @)
                 if (
                     "/@" in url
@@ -50,7 +50,7 @@ class DatabaseStorage:
         """
         return self.engine is not None
 
-    async def save_product_db(self, product: Product) -> bool:
+    def save_product_db_sync(self, product: Product) -> bool:
         """Save product to database with validation.
 
         Args:
@@ -167,8 +167,7 @@ class DatabaseStorage:
 
             # Use INSERT ... ON CONFLICT to handle duplicates
             # We insert a new record with scraped_at timestamp for history tracking
-            insert_sql = text(
-                """
+            insert_sql = text("""
                 INSERT INTO products (
                     id, name, type, category, categories, url, price, currency, is_free,
                     description, short_description,
@@ -237,8 +236,7 @@ class DatabaseStorage:
                     thumbnail_url = EXCLUDED.thumbnail_url,
                     screenshots_count = EXCLUDED.screenshots_count,
                     updated_at = CURRENT_TIMESTAMP
-            """
-            )
+            """)
 
             with self.engine.connect() as conn:
                 conn.execute(
@@ -301,7 +299,7 @@ class DatabaseStorage:
             logger.debug("product_saved_to_db", product_id=product.id)
 
             # Also save to history table
-            await self.save_product_history_db(product)
+            self.save_product_history_db_sync(product)
 
             return True
 
@@ -322,14 +320,17 @@ class DatabaseStorage:
             )
             return False
 
+    async def save_product_db(self, product: Product) -> bool:
+        """Async interface to save_product_db_sync (the engine is synchronous)."""
+        return self.save_product_db_sync(product)
+
     def _get_product_insert_sql(self) -> text:
         """Get reusable SQL for product batch insert.
 
         Returns:
             SQLAlchemy text object with INSERT ... ON CONFLICT statement
         """
-        return text(
-            """
+        return text("""
             INSERT INTO products (
                 id, name, type, category, categories, url, price, currency, is_free,
                 description, short_description,
@@ -398,10 +399,9 @@ class DatabaseStorage:
                 thumbnail_url = EXCLUDED.thumbnail_url,
                 screenshots_count = EXCLUDED.screenshots_count,
                 updated_at = CURRENT_TIMESTAMP
-        """
-        )
+        """)
 
-    async def save_product_history_db(self, product: Product) -> bool:
+    def save_product_history_db_sync(self, product: Product) -> bool:
         """Save product version to history table.
 
         This method always inserts a new record (never updates) to maintain
@@ -429,8 +429,7 @@ class DatabaseStorage:
                     scraped_at = datetime.utcnow()
 
             # Insert into history table (always insert, never update)
-            insert_sql = text(
-                """
+            insert_sql = text("""
                 INSERT INTO product_history (
                     product_id, scraped_at,
                     name, type, category, url, price, currency, is_free,
@@ -462,8 +461,7 @@ class DatabaseStorage:
                     :is_responsive, :has_animations, :cms_integration,
                     :pages_count, :thumbnail_url, :screenshots_count
                 )
-            """
-            )
+            """)
 
             with self.engine.connect() as conn:
                 conn.execute(
@@ -496,14 +494,17 @@ class DatabaseStorage:
             )
             return False
 
+    async def save_product_history_db(self, product: Product) -> bool:
+        """Async interface to save_product_history_db_sync (the engine is synchronous)."""
+        return self.save_product_history_db_sync(product)
+
     def _get_product_insert_sql(self) -> text:
         """Get reusable SQL for product batch insert.
 
         Returns:
             SQLAlchemy text object with INSERT ... ON CONFLICT statement
         """
-        return text(
-            """
+        return text("""
             INSERT INTO products (
                 id, name, type, category, categories, url, price, currency, is_free,
                 description, short_description,
@@ -572,8 +573,7 @@ class DatabaseStorage:
                 thumbnail_url = EXCLUDED.thumbnail_url,
                 screenshots_count = EXCLUDED.screenshots_count,
                 updated_at = CURRENT_TIMESTAMP
-        """
-        )
+        """)
 
     def _prepare_product_data(self, product: Product) -> dict:
         """Prepare product data for database insertion.
@@ -710,7 +710,7 @@ class DatabaseStorage:
             ),
         }
 
-    async def save_products_batch_db(self, products: List[Product]) -> int:
+    def save_products_batch_db_sync(self, products: List[Product]) -> int:
         """Save multiple products to database in a single batch operation.
 
         Args:
@@ -748,7 +748,7 @@ class DatabaseStorage:
 
             # Also save to history table
             for product in valid_products:
-                await self.save_product_history_db(product)
+                self.save_product_history_db_sync(product)
 
             return len(valid_products)
 
@@ -769,6 +769,10 @@ class DatabaseStorage:
             )
             return 0
 
+    async def save_products_batch_db(self, products: List[Product]) -> int:
+        """Async interface to save_products_batch_db_sync (the engine is synchronous)."""
+        return self.save_products_batch_db_sync(products)
+
     async def _save_products_batch_chunk(self, valid_products: List[Product]) -> int:
         """Save a chunk of products to database (internal helper).
 
@@ -810,7 +814,7 @@ class DatabaseStorage:
             )
             return 0
 
-    async def save_creator_db(self, creator: Creator) -> bool:
+    def save_creator_db_sync(self, creator: Creator) -> bool:
         """Save creator to database.
 
         Args:
@@ -830,8 +834,7 @@ class DatabaseStorage:
                 json_lib.dumps(creator.social_media) if creator.social_media else None
             )
 
-            insert_sql = text(
-                """
+            insert_sql = text("""
                 INSERT INTO creators (
                     username, name, profile_url, avatar_url, bio, website,
                     social_media, total_products, templates_count, components_count,
@@ -858,8 +861,7 @@ class DatabaseStorage:
                     plugins_count = EXCLUDED.plugins_count,
                     total_sales = EXCLUDED.total_sales,
                     updated_at = CURRENT_TIMESTAMP
-            """
-            )
+            """)
 
             with self.engine.connect() as conn:
                 conn.execute(
@@ -902,6 +904,10 @@ class DatabaseStorage:
             )
             return False
 
+    async def save_creator_db(self, creator: Creator) -> bool:
+        """Async interface to save_creator_db_sync (the engine is synchronous)."""
+        return self.save_creator_db_sync(creator)
+
     def _prepare_creator_data(self, creator: Creator) -> dict:
         """Prepare creator data for database insertion.
 
@@ -931,7 +937,7 @@ class DatabaseStorage:
             "total_sales": creator.stats.total_sales,
         }
 
-    async def save_creators_batch_db(self, creators: List[Creator]) -> int:
+    def save_creators_batch_db_sync(self, creators: List[Creator]) -> int:
         """Save multiple creators to database in a single batch operation.
 
         Uses true batch INSERT with multiple VALUES for better performance.
@@ -1039,7 +1045,11 @@ class DatabaseStorage:
             )
             return 0
 
-    async def save_category_db(self, category: Category) -> bool:
+    async def save_creators_batch_db(self, creators: List[Creator]) -> int:
+        """Async interface to save_creators_batch_db_sync (the engine is synchronous)."""
+        return self.save_creators_batch_db_sync(creators)
+
+    def save_category_db_sync(self, category: Category) -> bool:
         """Save category to database.
 
         Args:
@@ -1062,8 +1072,7 @@ class DatabaseStorage:
                 json_lib.dumps(category.subcategories) if category.subcategories else None
             )
 
-            insert_sql = text(
-                """
+            insert_sql = text("""
                 INSERT INTO categories (
                     slug, name, url, description, product_count,
                     product_types, parent_category, subcategories,
@@ -1082,8 +1091,7 @@ class DatabaseStorage:
                     parent_category = EXCLUDED.parent_category,
                     subcategories = CAST(EXCLUDED.subcategories AS jsonb),
                     updated_at = CURRENT_TIMESTAMP
-            """
-            )
+            """)
 
             with self.engine.connect() as conn:
                 conn.execute(
@@ -1120,3 +1128,7 @@ class DatabaseStorage:
                 error_type=type(e).__name__,
             )
             return False
+
+    async def save_category_db(self, category: Category) -> bool:
+        """Async interface to save_category_db_sync (the engine is synchronous)."""
+        return self.save_category_db_sync(category)
@@ -6,13 +6,13 @@ from pathlib import Path
 from typing import Optional
 
 import aiofiles
-import pandas as pd
 
 from src.config.settings import settings
 from src.models.product import Product
 from src.models.creator import Creator
 from src.models.category import Category
 from src.utils.logger import get_logger
+from src.utils.serialization import dumps_pretty
 
 logger = get_logger(__name__)
 
@@ -70,8 +70,8 @@ class FileStorage:
             product_dict = product.model_dump(mode="json")
 
             # Save asynchronously
-            async with aiofiles.open(filepath, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(product_dict, indent=2, ensure_ascii=False, default=str))
+            async with aiofiles.open(filepath, "wb") as f:
+                await f.write(dumps_pretty(product_dict))
 
             logger.debug("product_saved", product_id=product.id, filepath=str(filepath))
             return True
@@ -102,8 +102,8 @@ class FileStorage:
             creator_dict = creator.model_dump(mode="json")
 
             # Save asynchronously
-            async with aiofiles.open(filepath, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(creator_dict, indent=2, ensure_ascii=False, default=str))
+            async with aiofiles.open(filepath, "wb") as f:
+                await f.write(dumps_pretty(creator_dict))
 
             logger.debug("creator_saved", username=creator.username, filepath=str(filepath))
             return True
@@ -134,8 +134,8 @@ class FileStorage:
             category_dict = category.model_dump(mode="json")
 
             # Save asynchronously
-            async with aiofiles.open(filepath, "w", encoding="utf-8") as f:
-                await f.write(json.dumps(category_dict, indent=2, ensure_ascii=False, default=str))
+            async with aiofiles.open(filepath, "wb") as f:
+                await f.write(dumps_pretty(category_dict))
 
             logger.debug("category_saved", slug=category.slug, filepath=str(filepath))
             return True
@@ -254,6 +254,9 @@ class FileStorage:
                 }
                 flattened_products.append(flattened)
 
+            # Imported here: pandas is only needed for CSV export and is slow to import
+            import pandas as pd
+
             # Create DataFrame
             df = pd.DataFrame(flattened_products)
 
@@ -325,6 +328,9 @@ class FileStorage:
                 }
                 flattened_creators.append(flattened)
 
+            # Imported here: pandas is only needed for CSV export and is slow to import
+            import pandas as pd
+
             # Create DataFrame
             df = pd.DataFrame(flattened_creators)
 
@@ -1,12 +1,14 @@
 """Checkpoint system for resuming scraping after interruption."""
 
-import json
+import asyncio
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Set
+from typing import Awaitable, Callable, Iterable, List, Optional, Set
 
 from src.config.settings import settings
 from src.utils.logger import get_logger
+from src.utils.serialization import dumps_pretty, loads
 
 logger = get_logger(__name__)
 
@@ -23,6 +25,23 @@ class CheckpointManager:
         self.checkpoint_file = Path(checkpoint_file or settings.checkpoint_file)
         self.checkpoint_file.parent.mkdir(parents=True, exist_ok=True)
         self._checkpoint_loaded = False  # Flag to track if checkpoint was already loaded
+        # In-memory checkpoint state, loaded from disk once and persisted on save
+        self._processed_urls: Optional[Set[str]] = None
+        self._failed_urls: Set[str] = set()
+        self._stats: dict = {}
+        # Saves run both on the event loop (flush) and in worker threads (flush_async):
+        # one at a time, and a snapshot never overwrites a newer one already on disk
+        self._save_lock = threading.RLock()
+        self._snapshot_seq = 0
+        self._saved_seq = 0
+
+    def _load_state(self) -> None:
+        """Load processed/failed URLs from the checkpoint file into memory (once)."""
+        if self._processed_urls is None:
+            checkpoint = self.load_checkpoint()
+            self._processed_urls = set(checkpoint["processed_urls"])
+            self._failed_urls = set(checkpoint["failed_urls"])
+            self._stats = checkpoint["stats"]
 
     def load_checkpoint(self) -> dict:
         """Load checkpoint data from file.
@@ -47,8 +66,8 @@ class CheckpointManager:
             }
 
         try:
-            with open(self.checkpoint_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(self.checkpoint_file, "rb") as f:
+                data = loads(f.read())
                 # Convert lists back to sets for faster lookups
                 processed = data.get("processed_urls", [])
                 failed = data.get("failed_urls", [])
@@ -74,16 +93,19 @@ class CheckpointManager:
         processed_urls: Set[str],
         failed_urls: Optional[Set[str]] = None,
         stats: Optional[dict] = None,
-    ) -> None:
+    ) -> bool:
         """Save checkpoint data to file.
 
         Args:
             processed_urls: Set of successfully processed URLs
             failed_urls: Set of URLs that failed (optional)
             stats: Statistics dictionary (optional)
+
+        Returns:
+            True if the checkpoint was written, False otherwise
         """
         if not settings.checkpoint_enabled:
-            return
+            return False
 
         try:
             checkpoint_data = {
@@ -95,16 +117,36 @@ class CheckpointManager:
 
             # Write to temporary file first, then rename (atomic operation)
             temp_file = self.checkpoint_file.with_suffix(".tmp")
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(checkpoint_data, f, indent=2, ensure_ascii=False)
-
-            temp_file.replace(self.checkpoint_file)
+            with self._save_lock:
+                with open(temp_file, "wb") as f:
+                    f.write(dumps_pretty(checkpoint_data))
+                temp_file.replace(self.checkpoint_file)
             logger.debug(
                 "checkpoint_saved", file=str(self.checkpoint_file), count=len(processed_urls)
             )
+            return True
 
         except Exception as e:
             logger.error("checkpoint_save_error", file=str(self.checkpoint_file), error=str(e))
+            return False
+
+    def _save_snapshot(
+        self, seq: int, processed_urls: Set[str], failed_urls: Set[str], stats: dict
+    ) -> None:
+        """Save a numbered snapshot of the state unless a newer one was already saved.
+
+        Args:
+            seq: Snapshot number (taken when the state was copied)
+            processed_urls: Set of successfully processed URLs
+            failed_urls: Set of URLs that failed
+            stats: Statistics dictionary
+        """
+        with self._save_lock:
+            if seq <= self._saved_seq:
+                logger.debug("checkpoint_snapshot_superseded", seq=seq)
+                return
+            if self.save_checkpoint(processed_urls, failed_urls, stats):
+                self._saved_seq = seq
 
     def is_processed(self, url: str) -> bool:
         """Check if URL has been processed.
@@ -115,12 +157,24 @@ class CheckpointManager:
         Returns:
             True if URL is in processed set
         """
-        checkpoint = self.load_checkpoint()
-        processed = checkpoint["processed_urls"]
-        # Ensure it's a set for membership check
-        if not isinstance(processed, set):
-            processed = set(processed) if processed else set()
-        return url in processed
+        self._load_state()
+        return url in self._processed_urls
+
+    def filter_unprocessed(self, urls: List[str]) -> List[str]:
+        """Drop already processed URLs in a single pass over the in-memory set.
+
+        Args:
+            urls: URLs to filter
+
+        Returns:
+            URLs not yet processed, in their original order
+        """
+        self._load_state()
+        processed = self._processed_urls
+        if not processed:
+            # Fresh run: nothing to look up
+            return list(urls)
+        return [url for url in urls if url not in processed]
 
     def add_processed(self, url: str, save_immediately: bool = True) -> None:
         """Add URL to processed set and optionally save checkpoint.
@@ -129,43 +183,87 @@ class CheckpointManager:
             url: URL that was successfully processed
             save_immediately: If True, save checkpoint immediately. If False, only add to in-memory set.
         """
-        checkpoint = self.load_checkpoint()
-        # Ensure processed_urls is a set
-        processed = checkpoint["processed_urls"]
-        if not isinstance(processed, set):
-            processed = set(processed) if processed else set()
-        processed.add(url)
-        checkpoint["processed_urls"] = processed
+        self._load_state()
+        self._processed_urls.add(url)
 
         if save_immediately:
-            self.save_checkpoint(
-                checkpoint["processed_urls"],
-                checkpoint["failed_urls"],
-                checkpoint["stats"],
-            )
+            self.flush()
 
-    def add_failed(self, url: str) -> None:
-        """Add URL to failed set and save checkpoint.
+    def add_failed(self, url: str, save_immediately: bool = True) -> None:
+        """Add URL to failed set and optionally save checkpoint.
 
         Args:
             url: URL that failed to process
+            save_immediately: If True, save checkpoint immediately. If False, only add to in-memory set.
         """
-        checkpoint = self.load_checkpoint()
-        # Ensure failed_urls is a set
-        failed = checkpoint["failed_urls"]
-        if not isinstance(failed, set):
-            failed = set(failed) if failed else set()
-        failed.add(url)
-        checkpoint["failed_urls"] = failed
-
-        self.save_checkpoint(
-            checkpoint["processed_urls"],
-            checkpoint["failed_urls"],
-            checkpoint["stats"],
+        self._load_state()
+        self._failed_urls.add(url)
+
+        if save_immediately:
+            self.flush()
+
+    def mark_failed(self, urls: Iterable[str]) -> None:
+        """Move URLs back from the processed set to the failed set (in memory only).
+
+        Args:
+            urls: URLs whose results could not be stored after all
+        """
+        self._load_state()
+        for url in urls:
+            self._processed_urls.discard(url)
+            self._failed_urls.add(url)
+
+    def flush(self, stats: Optional[dict] = None) -> None:
+        """Save the in-memory checkpoint state to file.
+
+        Args:
+            stats: Statistics dictionary (optional, defaults to the last saved stats)
+        """
+        self._load_state()
+        if stats is not None:
+            self._stats = stats
+        self._snapshot_seq += 1
+        self._save_snapshot(
+            self._snapshot_seq, self._processed_urls, self._failed_urls, self._stats
+        )
+
+    async def flush_async(
+        self,
+        stats: Optional[dict] = None,
+        before_save: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> None:
+        """Save the in-memory checkpoint state without blocking the event loop.
+
+        The URL sets are copied first, so scraping can keep adding to them while
+        the checkpoint is serialized in a worker thread.
+
+        Args:
+            stats: Statistics dictionary (optional, defaults to the last saved stats)
+            before_save: Awaited after the copy and before the write, e.g. to store the
+                results of the copied URLs first. URLs it moves back to the failed set
+                (see mark_failed) are saved as failed.
+        """
+        self._load_state()
+        if stats is not None:
+            self._stats = stats
+        self._snapshot_seq += 1
+        seq = self._snapshot_seq
+        processed_urls = set(self._processed_urls)
+        failed_urls = set(self._failed_urls)
+        if before_save is not None:
+            await before_save()
+            # URLs processed after the copy stay out of it; URLs failed since are added
+            processed_urls &= self._processed_urls
+            failed_urls |= self._failed_urls
+        await asyncio.to_thread(
+            self._save_snapshot, seq, processed_urls, failed_urls, dict(self._stats)
         )
 
     def clear_checkpoint(self) -> None:
         """Clear checkpoint file."""
+        self._processed_urls = None
+        self._failed_urls = set()
+        self._stats = {}
         if self.checkpoint_file.exists():
             self.checkpoint_file.unlink()
             logger.info("checkpoint_cleared", file=str(self.checkpoint_file))
@@ -0,0 +1,115 @@
+"""Adaptive concurrency limit driven by observed scrape latency and failures."""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Outcomes kept for the latency / failure-rate window
+_WINDOW_SIZE = 100
+# Re-evaluate the limit after this many new outcomes
+_ADJUST_EVERY = 20
+# Shrink the limit above this failure rate; grow it only at or below the lower one.
+# Failures include pages that are simply gone (404), hence the tolerance.
+_MAX_FAILURE_RATE = 0.05
+_GROW_FAILURE_RATE = 0.01
+
+
+class AdmissionController:
+    """Caps in-flight scrapes at a limit that follows upstream latency and failures.
+
+    The limit is halved when the p95 latency exceeds the target or failures pile up,
+    and grows by one while the upstream is fast and healthy (additive increase,
+    multiplicative decrease). It stays between min_limit and max_limit.
+    """
+
+    def __init__(self, max_limit: int, target_latency: float, min_limit: int = 1):
+        """Initialize admission controller.
+
+        Args:
+            max_limit: Upper bound (and starting value) for concurrent scrapes
+            target_latency: p95 scrape latency in seconds above which the limit shrinks
+            min_limit: Lower bound for concurrent scrapes
+        """
+        self.max_limit = max_limit
+        self.min_limit = min(min_limit, max_limit)
+        self.limit = max_limit
+        self.target_latency = target_latency
+        self.active = 0
+        self._condition = asyncio.Condition()
+        self._latencies: deque = deque(maxlen=_WINDOW_SIZE)
+        self._failures: deque = deque(maxlen=_WINDOW_SIZE)
+        self._since_adjust = 0
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free under the current limit and take it."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.active < self.limit)
+            self.active += 1
+
+    async def release(self) -> None:
+        """Free a slot and wake as many waiters as the current limit allows."""
+        async with self._condition:
+            self.active -= 1
+            self._condition.notify(self.limit - self.active)
+
+    async def run(self, func: Callable[..., Awaitable[Any]], *args: Any) -> Any:
+        """Run func(*args) in a slot and record its latency and outcome.
+
+        Args:
+            func: Coroutine function to run (a falsy result counts as a failure)
+            *args: Arguments for func
+
+        Returns:
+            Result of func
+        """
+        await self.acquire()
+        started = time.monotonic()
+        result = False
+        try:
+            result = await func(*args)
+            return result
+        finally:
+            self.record(time.monotonic() - started, bool(result))
+            await self.release()
+
+    def record(self, latency: float, ok: bool) -> None:
+        """Record one scrape outcome, adjusting the limit every few outcomes.
+
+        Args:
+            latency: Scrape duration in seconds
+            ok: Whether the scrape succeeded
+        """
+        self._latencies.append(latency)
+        self._failures.append(not ok)
+        self._since_adjust += 1
+        if self._since_adjust >= _ADJUST_EVERY:
+            self._adjust()
+
+    def _adjust(self) -> None:
+        """Shrink or grow the limit from the latency / failure window."""
+        self._since_adjust = 0
+        latencies = sorted(self._latencies)
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        failure_rate = sum(self._failures) / len(self._failures)
+
+        if failure_rate > _MAX_FAILURE_RATE or p95 > self.target_latency:
+            new_limit = max(self.min_limit, self.limit // 2)
+        elif failure_rate <= _GROW_FAILURE_RATE and p95 < self.target_latency / 2:
+            new_limit = min(self.max_limit, self.limit + 1)
+        else:
+            return
+
+        if new_limit != self.limit:
+            logger.info(
+                "concurrency_limit_changed",
+                old_limit=self.limit,
+                new_limit=new_limit,
+                p95_latency=round(p95, 2),
+                failure_rate=round(failure_rate, 3),
+            )
+            self.limit = new_limit
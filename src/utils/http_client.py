@@ -0,0 +1,106 @@
+"""Shared HTTP client for scraping the Framer Marketplace."""
+
+from typing import Optional
+
+import httpx
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 support in httpx
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401 - enables Brotli (br) decoding in httpx
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+from src.config.settings import settings
+from src.utils.user_agents import get_random_user_agent
+
+
+async def _rotate_user_agent(request: httpx.Request) -> None:
+    """Request hook: send every request with a freshly picked User-Agent.
+
+    Args:
+        request: Outgoing request
+    """
+    request.headers["User-Agent"] = get_random_user_agent()
+
+
+def create_client() -> httpx.AsyncClient:
+    """Create an HTTP client configured for marketplace scraping.
+
+    Returns:
+        New httpx.AsyncClient (the caller is responsible for closing it)
+    """
+    # Set explicit timeouts: connect, read, write, pool
+    # This ensures requests are properly cancelled if they exceed timeout
+    timeout = httpx.Timeout(
+        connect=5.0,  # Connection timeout: 5s
+        read=settings.timeout,  # Read timeout: 12s (from settings)
+        write=5.0,  # Write timeout: 5s
+        pool=5.0,  # Pool timeout: 5s
+    )
+    # Size the pool to the concurrency limit so connections are reused instead of
+    # being torn down and re-opened (httpx defaults to 20 keep-alive connections)
+    limits = httpx.Limits(
+        max_connections=max(100, settings.max_concurrent_requests * 2),
+        max_keepalive_connections=max(50, settings.max_concurrent_requests),
+        keepalive_expiry=60.0,
+    )
+    # Use realistic browser headers to avoid bot detection
+    return httpx.AsyncClient(
+        timeout=timeout,
+        headers={
+            "User-Agent": get_random_user_agent(),
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+            # httpx auto-decompresses gzip/deflate, and Brotli (br) only when brotli is installed
+            "Accept-Encoding": "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate",
+            "Referer": settings.marketplace_url,
+            "Connection": "keep-alive",
+            "Sec-Fetch-Dest": "document",
+            "Sec-Fetch-Mode": "navigate",
+            "Sec-Fetch-Site": "same-origin",
+            "Upgrade-Insecure-Requests": "1",
+        },
+        follow_redirects=True,
+        # HTTP/2 multiplexes in-flight requests over one connection when h2 is installed.
+        # Set on the client rather than through a custom transport, which would disable
+        # the proxies configured in the environment (HTTP_PROXY / HTTPS_PROXY).
+        limits=limits,
+        http2=HTTP2_AVAILABLE,
+        # Rotate the User-Agent per request rather than once per session
+        event_hooks={"request": [_rotate_user_agent]},
+    )
+
+
+# Global shared client (kept open across scraping runs in long-running processes)
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get or create the process-wide HTTP client.
+
+    Reusing one client across scraping runs keeps its pooled connections (DNS, TCP and
+    TLS already done). Close it with close_shared_client() at process exit.
+
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = create_client()
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the process-wide HTTP client if it was created."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
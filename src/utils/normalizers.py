@@ -2,12 +2,62 @@
 
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, Optional
 
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Relative date patterns (compiled once)
+_MONTHS_RE = re.compile(r"(\d+)\s*months?", re.IGNORECASE)
+_MO_RE = re.compile(r"(\d+)mo", re.IGNORECASE)
+_WEEKS_RE = re.compile(r"(\d+)\s*w", re.IGNORECASE)
+_DAYS_RE = re.compile(r"(\d+)\s*days?", re.IGNORECASE)
+_HOURS_RE = re.compile(r"(\d+)\s*hours?", re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _parse_relative_offset(raw: str) -> Optional[timedelta]:
+    """Parse a relative date string into its offset from now.
+
+    The offset depends only on the text, so it is cached; the current time is
+    applied by the caller on every call.
+
+    Args:
+        raw: Stripped relative date string (e.g., "5 months ago", "3mo ago")
+
+    Returns:
+        Offset to subtract from now, or None if the format is not recognized
+    """
+    # Pattern matching for different formats
+    if "months ago" in raw or "month ago" in raw:
+        match = _MONTHS_RE.search(raw)
+        if match:
+            return timedelta(days=int(match.group(1)) * 30)
+
+    elif "mo ago" in raw or "mo" in raw:
+        match = _MO_RE.search(raw)
+        if match:
+            return timedelta(days=int(match.group(1)) * 30)
+
+    elif "weeks ago" in raw or "week ago" in raw or "w ago" in raw:
+        match = _WEEKS_RE.search(raw)
+        if match:
+            return timedelta(weeks=int(match.group(1)))
+
+    elif "days ago" in raw or "day ago" in raw:
+        match = _DAYS_RE.search(raw)
+        if match:
+            return timedelta(days=int(match.group(1)))
+
+    elif "hours ago" in raw or "hour ago" in raw:
+        match = _HOURS_RE.search(raw)
+        if match:
+            return timedelta(hours=int(match.group(1)))
+
+    return None
+
 
 def parse_relative_date(date_str: str) -> Dict[str, Optional[str]]:
     """Convert relative date format to normalized ISO 8601 format.
@@ -31,46 +81,10 @@ def parse_relative_date(date_str: str) -> Dict[str, Optional[str]]:
     raw = date_str.strip()
 
     try:
-        # Pattern matching for different formats
-        if "months ago" in raw or "month ago" in raw:
-            match = re.search(r"(\d+)\s*months?", raw, re.IGNORECASE)
-            if match:
-                months = int(match.group(1))
-                normalized_date = now - timedelta(days=months * 30)
-                normalized = normalized_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-                return {"raw": raw, "normalized": normalized}
-
-        elif "mo ago" in raw or "mo" in raw:
-            match = re.search(r"(\d+)mo", raw, re.IGNORECASE)
-            if match:
-                months = int(match.group(1))
-                normalized_date = now - timedelta(days=months * 30)
-                normalized = normalized_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-                return {"raw": raw, "normalized": normalized}
-
-        elif "weeks ago" in raw or "week ago" in raw or "w ago" in raw:
-            match = re.search(r"(\d+)\s*w", raw, re.IGNORECASE)
-            if match:
-                weeks = int(match.group(1))
-                normalized_date = now - timedelta(weeks=weeks)
-                normalized = normalized_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-                return {"raw": raw, "normalized": normalized}
-
-        elif "days ago" in raw or "day ago" in raw:
-            match = re.search(r"(\d+)\s*days?", raw, re.IGNORECASE)
-            if match:
-                days = int(match.group(1))
-                normalized_date = now - timedelta(days=days)
-                normalized = normalized_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-                return {"raw": raw, "normalized": normalized}
-
-        elif "hours ago" in raw or "hour ago" in raw:
-            match = re.search(r"(\d+)\s*hours?", raw, re.IGNORECASE)
-            if match:
-                hours = int(match.group(1))
-                normalized_date = now - timedelta(hours=hours)
-                normalized = normalized_date.strftime("%Y-%m-%dT%H:%M:%SZ")
-                return {"raw": raw, "normalized": normalized}
+        offset = _parse_relative_offset(raw)
+        if offset is not None:
+            normalized = (now - offset).strftime("%Y-%m-%dT%H:%M:%SZ")
+            return {"raw": raw, "normalized": normalized}
 
         # If parsing fails, return raw with None normalized
         logger.warning("date_parse_failed", raw=raw)
@@ -1,8 +1,10 @@
 """Retry logic with exponential backoff using tenacity."""
 
+import asyncio
 import functools
 import logging
 import random
+import time
 from typing import Any, Callable, Optional, Tuple, Type, TypeVar
 
 from tenacity import (
@@ -139,8 +141,6 @@ async def retry_async(
                     error=str(e),
                     error_type=type(e).__name__,
                 )
-                import asyncio
-
                 await asyncio.sleep(wait_time)
             else:
                 logger.error(
@@ -211,8 +211,6 @@ def retry_sync(
                     error=str(e),
                     error_type=type(e).__name__,
                 )
-                import time
-
                 time.sleep(wait_time)
             else:
                 logger.error(
@@ -0,0 +1,41 @@
+"""JSON serialization helpers (orjson when installed, stdlib json otherwise)."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_pretty(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON.
+
+    Values JSON cannot represent are converted with str(), as with json.dumps(default=str).
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        UTF-8 encoded JSON (2-space indent, non-ASCII characters kept as-is)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize JSON.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Deserialized data
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
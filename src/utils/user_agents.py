@@ -26,7 +26,12 @@ class UserAgentRotator:
             use_fake_useragent: Whether to use fake-useragent library
         """
         self.use_fake_useragent = use_fake_useragent and FAKE_USERAGENT_AVAILABLE
-        self.default_user_agents = settings.get_default_user_agents()
+        # Built once: an immutable tuple for random.choice, plus per-browser subsets
+        self.default_user_agents = tuple(settings.get_default_user_agents())
+        self._firefox_agents = tuple(ua for ua in self.default_user_agents if "Firefox" in ua)
+        self._safari_agents = tuple(
+            ua for ua in self.default_user_agents if "Safari" in ua and "Chrome" not in ua
+        )
         self._user_agent = None
 
         if self.use_fake_useragent:
@@ -92,9 +97,8 @@ class UserAgentRotator:
                 pass
 
         # Return Firefox from defaults
-        firefox_agents = [ua for ua in self.default_user_agents if "Firefox" in ua]
-        if firefox_agents:
-            return firefox_agents[0]
+        if self._firefox_agents:
+            return self._firefox_agents[0]
 
         return self.default_user_agents[0]
 
@@ -111,11 +115,8 @@ class UserAgentRotator:
                 pass
 
         # Return Safari from defaults
-        safari_agents = [
-            ua for ua in self.default_user_agents if "Safari" in ua and "Chrome" not in ua
-        ]
-        if safari_agents:
-            return safari_agents[0]
+        if self._safari_agents:
+            return self._safari_agents[0]
 
         return self.default_user_agents[2]  # Safari on Mac
 
@@ -1,6 +1,35 @@
 """Tests for ProductParser."""
 
-from src.parsers.product_parser import ProductParser
+from bs4 import BeautifulSoup
+
+from src.parsers.product_parser import _STRAINER, ProductParser, _parse_worker
+
+# Product page in the shape the marketplace serves: head styles/preloads, and statistics,
+# price and update date in tags outside any div/p/span
+_PRODUCT_PAGE_HTML = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="utf-8">
+    <title>Portfolio Pro - Framer Marketplace</title>
+    <meta property="og:title" content="Portfolio Pro">
+    <link rel="preload" href="/fonts/inter.woff2" as="font">
+    <link rel="stylesheet" href="/_next/static/css/app.css">
+    <style>.hero{display:grid}.price{font-weight:600}</style>
+    <script id="__NEXT_DATA__" type="application/json">{"props":{}}</script>
+</head>
+<body>
+    <main>
+        <h1>Portfolio Pro</h1>
+        <strong>$49</strong>
+        <dl><dd>12 Pages</dd><dd>19.8K Views</dd></dl>
+        <article><em>Updated 3 months ago</em></article>
+        <table><tr><td>Version 4</td></tr></table>
+        <svg viewBox="0 0 10 10"><path d="M0 0h10v10H0z"/></svg>
+    </main>
+</body>
+</html>
+"""
 
 
 class TestProductParser:
@@ -76,3 +105,109 @@ class TestProductParser:
         assert product.id == "test"
         assert product.type == "template"
         assert str(product.url) == url
+
+    def test_strainer_keeps_page_text(self):
+        """Test that the parse strainer leaves the page text used by the regexes intact."""
+        strained = BeautifulSoup(_PRODUCT_PAGE_HTML, "lxml", parse_only=_STRAINER)
+        full = BeautifulSoup(_PRODUCT_PAGE_HTML, "lxml")
+
+        # Only whitespace between <head> tags may differ
+        assert strained.get_text().split() == full.get_text().split()
+        assert strained.find("script", id="__NEXT_DATA__") is not None
+        assert strained.find("style") is None
+
+    def test_parse_reads_stats_outside_strained_tags(self):
+        """Test that statistics in <dd> tags reach the product."""
+        parser = ProductParser()
+        url = "https://www.framer.com/marketplace/templates/portfolio-pro/"
+
+        product = parser.parse(_PRODUCT_PAGE_HTML, url, "template")
+
+        assert product.stats.pages.raw == "12 Pages"
+        assert product.stats.views.raw == "19.8K Views"
+
+    def test_extract_statistics_by_type(self):
+        """Test that only the statistics shown for a product type are extracted."""
+        parser = ProductParser()
+        text = "12 Pages 19.8K Views 3.5K Users 1,200 Vectors"
+
+        stats = parser._extract_statistics(None, "template", text)
+        assert stats.pages.raw == "12 Pages"
+        assert stats.views.raw == "19.8K Views"
+        assert stats.users is None
+
+        stats = parser._extract_statistics(None, "vector", text)
+        assert stats.users.raw == "3.5K Users"
+        assert stats.vectors.raw == "1,200 Vectors"
+        assert stats.pages is None
+
+    def test_extract_meta_tags(self):
+        """Test extracting og/description meta tags from raw HTML."""
+        parser = ProductParser()
+        html = """
+        <head>
+            <meta content="Tom &amp; Jerry" property="og:title">
+            <meta name='description' content='A template'>
+            <meta property="og:image" content="https://example.com/og.png" />
+            <meta property="og:title" content="Second title">
+        </head>
+        """
+
+        meta = parser._extract_meta_tags(html)
+        assert meta["og:title"] == "Tom & Jerry"
+        assert meta["description"] == "A template"
+        assert meta["og:image"] == "https://example.com/og.png"
+        assert "og:description" not in meta
+
+    def test_extract_meta_tags_quoting(self):
+        """Test quoted '>' in values and unquoted attribute values."""
+        parser = ProductParser()
+        html = """
+        <meta property="og:title" content="Fast > Slow template">
+        <meta name=description content=Minimal>
+        """
+
+        meta = parser._extract_meta_tags(html)
+        assert meta["og:title"] == "Fast > Slow template"
+        assert meta["description"] == "Minimal"
+
+    def test_extract_meta_tags_skips_scripts_and_comments(self):
+        """Test that <meta> strings inside scripts and comments are not read."""
+        parser = ProductParser()
+        html = """
+        <script>var s = '<meta property="og:image" content="evil">';</script>
+        <!-- <meta property="og:title" content="Old title"> -->
+        <meta property="og:image" content="https://example.com/og.png">
+        """
+
+        meta = parser._extract_meta_tags(html)
+        assert meta["og:image"] == "https://example.com/og.png"
+        assert "og:title" not in meta
+
+    def test_parse_many_preserves_order(self):
+        """Test parsing several pages in worker processes."""
+        parser = ProductParser()
+        jobs = [
+            (
+                f"<html><head><title>Product {i} - Framer Marketplace</title></head></html>",
+                f"https://www.framer.com/marketplace/templates/product-{i}/",
+                "template",
+            )
+            for i in range(3)
+        ]
+
+        products = parser.parse_many(jobs, max_workers=2)
+
+        assert [product.id for product in products] == ["product-0", "product-1", "product-2"]
+
+    def test_parse_worker_without_initializer(self):
+        """Test that the worker entry point also works outside an initialized pool."""
+        product = _parse_worker(
+            (
+                "<html><head><title>Product - Framer Marketplace</title></head></html>",
+                "https://www.framer.com/marketplace/templates/product/",
+                "template",
+            )
+        )
+
+        assert product.id == "product"
@@ -0,0 +1,130 @@
+"""Tests for CategoryScraper."""
+
+import json
+
+import httpx
+
+from src.config.settings import settings
+from src.scrapers.category_scraper import CategoryScraper
+
+
+class TestCategoryScraper:
+    """Tests for CategoryScraper."""
+
+    async def test_scrape_category_reuses_client(self):
+        """Test that category pages are fetched through one shared client."""
+        requested_urls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested_urls.append(str(request.url))
+            return httpx.Response(200, text="<html>category</html>")
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            scraper = CategoryScraper(client)
+            html = await scraper.scrape_category("/marketplace/category/saas/")
+            await scraper.scrape_category("/marketplace/category/ai/")
+
+            assert html == "<html>category</html>"
+            assert scraper.client is client
+            assert requested_urls == [
+                "https://www.framer.com/marketplace/category/saas/",
+                "https://www.framer.com/marketplace/category/ai/",
+            ]
+
+            # A client passed in by the caller is not closed by the scraper
+            await scraper.aclose()
+            assert not client.is_closed
+
+    async def test_scrape_category_uses_cache_on_not_modified(self, tmp_path, monkeypatch):
+        """Test that a 304 response is served from the category cache."""
+        monkeypatch.setattr(settings, "category_cache_enabled", True)
+        monkeypatch.setattr(settings, "category_cache_dir", str(tmp_path))
+        conditional_headers = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            conditional_headers.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text="<html>v1</html>", headers={"ETag": '"v1"'})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            first_scraper = CategoryScraper(client)
+            first = await first_scraper.scrape_category("/marketplace/category/saas/")
+            await first_scraper.aclose()
+            # A new scraper instance reads the validators back from disk
+            second = await CategoryScraper(client).scrape_category("/marketplace/category/saas/")
+
+        assert first == second == "<html>v1</html>"
+        assert conditional_headers == [None, '"v1"']
+
+    async def test_scrape_many_writes_cache_index_once(self, tmp_path, monkeypatch):
+        """Test that the cache index is written once per batch, without temp files left."""
+        monkeypatch.setattr(settings, "category_cache_enabled", True)
+        monkeypatch.setattr(settings, "category_cache_dir", str(tmp_path))
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, text=request.url.path, headers={"ETag": '"v1"'})
+
+        index_path = tmp_path / "index.json"
+        real_replace = type(index_path).replace
+        index_writes = []
+
+        def counting_replace(path, target):
+            if path.name == "index.json.tmp":
+                index_writes.append(target)
+            return real_replace(path, target)
+
+        monkeypatch.setattr(type(index_path), "replace", counting_replace)
+
+        urls = [f"/marketplace/category/c{i}/" for i in range(5)]
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            scraper = CategoryScraper(client)
+            await scraper.scrape_many(urls, concurrency=2)
+            await scraper.aclose()
+
+        assert len(index_writes) == 1
+        assert len(json.loads(index_path.read_text(encoding="utf-8"))) == 5
+        assert not list(tmp_path.glob("*.tmp"))
+
+    async def test_scrape_many_preserves_order(self):
+        """Test scraping several category pages concurrently."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/missing/"):
+                return httpx.Response(404)
+            return httpx.Response(200, text=request.url.path)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            scraper = CategoryScraper(client)
+            pages = await scraper.scrape_many(
+                [
+                    "/marketplace/category/saas/",
+                    "/marketplace/category/missing/",
+                    "/marketplace/category/ai/",
+                ],
+                concurrency=2,
+            )
+
+        assert pages == ["/marketplace/category/saas/", None, "/marketplace/category/ai/"]
+
+    async def test_context_manager_prewarms_and_closes_own_client(self, monkeypatch):
+        """Test that an owned client is prewarmed on entry and closed on exit."""
+        methods = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            methods.append(request.method)
+            return httpx.Response(200)
+
+        real_async_client = httpx.AsyncClient
+        monkeypatch.setattr(
+            httpx,
+            "AsyncClient",
+            lambda **kwargs: real_async_client(transport=httpx.MockTransport(handler), **kwargs),
+        )
+
+        async with CategoryScraper() as scraper:
+            client = scraper.client
+            assert methods == ["HEAD"]
+
+        assert client.is_closed
+        assert scraper.client is None
@@ -0,0 +1,24 @@
+"""Tests for CreatorScraper."""
+
+from src.scrapers.creator_scraper import CreatorScraper
+
+
+class TestCreatorScraper:
+    """Tests for CreatorScraper."""
+
+    def test_normalize_profile_url(self):
+        """Test normalizing relative and absolute profile URLs."""
+        scraper = CreatorScraper()
+
+        expected = "https://www.framer.com/@ev-studio"
+        assert scraper.normalize_profile_url("https://www.framer.com/@ev-studio/") == expected
+        assert scraper.normalize_profile_url("/@ev-studio/") == expected
+        assert scraper.normalize_profile_url("@ev-studio") == expected
+        assert scraper.normalize_profile_url("ev-studio/") == expected
+
+    def test_extract_username_from_url(self):
+        """Test extracting username from profile URL."""
+        scraper = CreatorScraper()
+
+        assert scraper.extract_username_from_url("https://www.framer.com/@-790ivi/") == "-790ivi"
+        assert scraper.extract_username_from_url("https://www.framer.com/marketplace/") is None
@@ -0,0 +1,404 @@
+"""Tests for MarketplaceScraper."""
+
+import asyncio
+import time
+
+from src.config.settings import settings
+from src.models.creator import Creator
+from src.models.product import Product
+from src.utils.checkpoint import CheckpointManager
+from src.scrapers.marketplace_scraper import (
+    MarketplaceScraper,
+    _product_url_key,
+    _sitemap_retry_base_delay,
+)
+
+
+class _CachedSitemapScraper:
+    """Sitemap scraper stub whose upstream always falls back to the cache."""
+
+    def __init__(self):
+        self.calls = 0
+        self.parses = 0
+        self.cache_used = True
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def get_sitemap(self):
+        self.calls += 1
+        return (b"<urlset></urlset>", self.cache_used, 2.5 if self.cache_used else 0.0)
+
+    def parse_sitemap(self, xml_content):
+        self.parses += 1
+        return {"products": {}, "categories": [], "profiles": [], "help_articles": []}
+
+
+class _CreatorScraperStub:
+    """Creator scraper stub that counts profile fetches."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def scrape(self, url):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return {"url": url, "html": "<html><h1>EV Studio</h1></html>", "username": "ev-studio"}
+
+
+class _ProductScraperStub:
+    """Product scraper stub that counts page fetches."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def scrape(self, url):
+        self.calls += 1
+        return None
+
+
+class _StorageStub:
+    """File storage stub that accepts every write."""
+
+    def __init__(self):
+        self.creators = []
+
+    async def save_product_json(self, product):
+        return True
+
+    async def save_creator_json(self, creator):
+        self.creators.append(creator.username)
+        return True
+
+
+class _DatabaseStub:
+    """Database storage stub that records bulk inserts."""
+
+    def __init__(self, available=True, delay=0.0):
+        self.available = available
+        self.delay = delay
+        self.batches = []
+        self.creators = []
+        self.creator_batches = []
+
+    def is_available(self):
+        return True
+
+    def save_products_batch_db_sync(self, products):
+        time.sleep(self.delay)
+        if not self.available:
+            return 0
+        self.batches.append([product.id for product in products])
+        return len(products)
+
+    def save_creator_db_sync(self, creator):
+        self.creators.append(creator.username)
+        return True
+
+    def save_creators_batch_db_sync(self, creators):
+        self.creator_batches.append([creator.username for creator in creators])
+        return len(creators)
+
+
+def _product(index):
+    return Product(
+        id=f"product-{index}",
+        name=f"Product {index}",
+        type="template",
+        url=f"https://www.framer.com/marketplace/templates/product-{index}/",
+    )
+
+
+class TestMarketplaceScraper:
+    """Tests for MarketplaceScraper."""
+
+    def test_sitemap_retry_backoff_is_capped(self):
+        """Test the sitemap retry schedule grows exponentially up to the cap."""
+        delays = [_sitemap_retry_base_delay(n) for n in range(1, 8)]
+        assert delays == [0.0, 1.0, 2.0, 4.0, 8.0, 16.0, 30.0]
+        assert _sitemap_retry_base_delay(20) == 30.0
+
+    def test_product_url_key_ignores_tracking_variants(self):
+        """Test that case, query, fragment and trailing slash do not change the key."""
+        url = "https://www.framer.com/marketplace/templates/product-1/"
+        variants = [
+            "https://www.framer.com/marketplace/templates/product-1",
+            "https://www.framer.com/marketplace/templates/Product-1/?utm_source=x",
+            "https://WWW.framer.com/marketplace/templates/product-1/#pricing",
+        ]
+        assert all(_product_url_key(v) == _product_url_key(url) for v in variants)
+        assert _product_url_key(url) != _product_url_key(url.replace("product-1", "product-2"))
+
+    async def test_initial_retry_returns_cache_immediately(self):
+        """Test that a cached sitemap is used right away instead of retrying."""
+        scraper = MarketplaceScraper()
+        scraper.sitemap_scraper = _CachedSitemapScraper()
+
+        sitemap_data, cache_used, cache_age_hours = await scraper._get_sitemap_with_initial_retry()
+
+        assert scraper.sitemap_scraper.calls == 1
+        assert cache_used is True
+        assert cache_age_hours == 2.5
+        assert sitemap_data["products"] == {}
+
+    async def test_refresh_skips_parse_of_unchanged_sitemap(self):
+        """Test that a refresh returning the cached XML again is not parsed a second time."""
+        scraper = MarketplaceScraper()
+        scraper.sitemap_scraper = _CachedSitemapScraper()
+        await scraper._get_sitemap_with_initial_retry()
+        scraper.types_to_scrape = ["template"]
+        scraper.fresh_sitemap_obtained = False
+        scraper.refresh_lock = asyncio.Lock()
+
+        scraper.sitemap_scraper.cache_used = False
+        await scraper._attempt_sitemap_refresh(0.25)
+
+        assert scraper.fresh_sitemap_obtained
+        assert scraper.sitemap_scraper.parses == 1
+
+    async def test_sitemap_is_fetched_once_per_instance(self):
+        """Test that later modes reuse the sitemap fetched by the first one."""
+        scraper = MarketplaceScraper()
+        scraper.sitemap_scraper = _CachedSitemapScraper()
+
+        first = await scraper._get_sitemap_cached(scraper._get_sitemap_with_initial_retry)
+        second = await scraper._get_sitemap_cached(scraper._get_sitemap_with_initial_retry)
+
+        assert scraper.sitemap_scraper.calls == 1
+        assert second is first
+
+    async def test_get_creator_coalesces_fetches(self):
+        """Test that concurrent products of one creator share a single profile fetch."""
+        scraper = MarketplaceScraper()
+        scraper.creator_scraper = _CreatorScraperStub()
+
+        results = await asyncio.gather(
+            *(scraper._get_creator("https://www.framer.com/@ev-studio/") for _ in range(3))
+        )
+
+        assert scraper.creator_scraper.calls == 1
+        assert [fetched for _, fetched in results] == [True, False, False]
+        assert all(creator.username == "ev-studio" for creator, _ in results)
+
+    async def test_batched_products_are_bulk_saved_on_flush(self, monkeypatch):
+        """Test that batch-mode product DB writes are buffered into one bulk insert."""
+        monkeypatch.setattr(settings, "checkpoint_enabled", False)
+        scraper = MarketplaceScraper()
+        scraper.storage = _StorageStub()
+        scraper.db_storage = _DatabaseStub()
+        products = [
+            Product(
+                id=f"product-{i}",
+                name=f"Product {i}",
+                type="template",
+                url=f"https://www.framer.com/marketplace/templates/product-{i}/",
+            )
+            for i in range(3)
+        ]
+
+        for product in products:
+            assert await scraper._save_product(str(product.url), product, None, False, False)
+        assert scraper.db_storage.batches == []
+
+        await scraper.flush_writes()
+        assert scraper.db_storage.batches == [[p.id for p in products]]
+
+    async def test_failed_bulk_insert_marks_urls_failed(self, monkeypatch, tmp_path):
+        """Test that URLs of a failed bulk insert are moved back to the failed set."""
+        monkeypatch.setattr(settings, "checkpoint_enabled", True)
+        scraper = MarketplaceScraper()
+        scraper.checkpoint_manager = CheckpointManager(str(tmp_path / "checkpoint.json"))
+        scraper.storage = _StorageStub()
+        scraper.db_storage = _DatabaseStub(available=False)
+        product = _product(1)
+
+        assert await scraper._save_product(str(product.url), product, None, False, False)
+        assert scraper.checkpoint_manager.is_processed(str(product.url))
+
+        await scraper._save_checkpoint()
+
+        checkpoint = scraper.checkpoint_manager.load_checkpoint()
+        assert checkpoint["processed_urls"] == set()
+        assert checkpoint["failed_urls"] == {str(product.url)}
+
+    async def test_checkpoint_skips_urls_saved_during_the_db_flush(self, monkeypatch, tmp_path):
+        """Test that a checkpoint only holds URLs whose rows were flushed before it."""
+        monkeypatch.setattr(settings, "checkpoint_enabled", True)
+        scraper = MarketplaceScraper()
+        scraper.checkpoint_manager = CheckpointManager(str(tmp_path / "checkpoint.json"))
+        scraper.storage = _StorageStub()
+        scraper.db_storage = _DatabaseStub(delay=0.05)
+        first, second = _product(1), _product(2)
+
+        await scraper._save_product(str(first.url), first, None, False, False)
+        pending_save = asyncio.create_task(scraper._save_checkpoint())
+        await asyncio.sleep(0.01)
+        # Saved while the first bulk insert is still running
+        await scraper._save_product(str(second.url), second, None, False, False)
+        await pending_save
+
+        checkpoint = scraper.checkpoint_manager.load_checkpoint()
+        assert checkpoint["processed_urls"] == {str(first.url)}
+        assert scraper.db_storage.batches == [["product-1"]]
+
+    async def test_exit_saves_products_queued_by_background_scrapes(self, monkeypatch):
+        """Test that a product queued by a background scrape during exit is still saved."""
+        monkeypatch.setattr(settings, "checkpoint_enabled", False)
+        product = Product(
+            id="product-1",
+            name="Product 1",
+            type="template",
+            url="https://www.framer.com/marketplace/templates/product-1/",
+        )
+
+        async with MarketplaceScraper() as scraper:
+            scraper.storage = _StorageStub()
+            scraper.db_storage = _DatabaseStub()
+            writers = list(scraper._writer_tasks)
+
+            async def background_scrape():
+                await asyncio.sleep(0.01)
+                await scraper._write_queue.put((str(product.url), product, None, False, False))
+
+            task = asyncio.create_task(background_scrape())
+            scraper._background_scrapes.add(task)
+            task.add_done_callback(scraper._background_scrapes.discard)
+
+        assert scraper.db_storage.batches == [["product-1"]]
+        assert all(writer.done() and not writer.cancelled() for writer in writers)
+
+    async def test_run_bounded_caps_concurrency(self):
+        """Test that the worker pool never runs more than `limit` scrapes at once."""
+        scraper = MarketplaceScraper()
+        running = 0
+        peak = 0
+
+        async def scrape_one(url, index, total):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return index % 2 == 0
+
+        urls = [f"https://www.framer.com/@creator-{i}/" for i in range(10)]
+        success_count = await scraper._run_bounded(urls, scrape_one, 3, "Scraping creators")
+
+        assert peak == 3
+        assert success_count == 5
+
+    async def test_concurrent_batches_share_the_request_budget(self, monkeypatch):
+        """Test that two batches running at once stay within max_concurrent_requests."""
+        monkeypatch.setattr(settings, "max_concurrent_requests", 2)
+        monkeypatch.setattr(settings, "adaptive_concurrency", False)
+        scraper = MarketplaceScraper()
+        running = 0
+        peak = 0
+
+        async def scrape_one(url, index, total):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return True
+
+        urls = [f"https://www.framer.com/@creator-{i}/" for i in range(6)]
+        await asyncio.gather(
+            scraper._run_bounded(urls, scrape_one, 2), scraper._run_bounded(urls, scrape_one, 2)
+        )
+
+        assert peak == 2
+
+    async def test_larger_limit_raises_the_request_budget(self, monkeypatch):
+        """Test that a batch limit above max_concurrent_requests is not capped by it."""
+        monkeypatch.setattr(settings, "max_concurrent_requests", 2)
+        monkeypatch.setattr(settings, "adaptive_concurrency", False)
+        scraper = MarketplaceScraper()
+        running = 0
+        peak = 0
+
+        async def scrape_one(url, index, total):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return True
+
+        urls = [f"https://www.framer.com/@creator-{i}/" for i in range(8)]
+        await scraper._run_bounded(urls, scrape_one, 4)
+        assert peak == 4
+
+        # The raised budget is shared: two batches together still stay within it
+        peak = 0
+        await asyncio.gather(
+            scraper._run_bounded(urls, scrape_one, 4), scraper._run_bounded(urls, scrape_one, 4)
+        )
+        assert peak == 4
+
+    async def test_duplicate_creator_skips_storage(self, monkeypatch):
+        """Test that a creator seen before is not written to JSON or the database again."""
+        monkeypatch.setattr(settings, "checkpoint_enabled", False)
+        scraper = MarketplaceScraper()
+        scraper.creator_scraper = _CreatorScraperStub()
+        scraper.storage = _StorageStub()
+        scraper.db_storage = _DatabaseStub()
+
+        assert await scraper.scrape_creator("https://www.framer.com/@ev-studio/")
+        assert await scraper.scrape_creator("https://www.framer.com/@ev-studio")
+
+        assert scraper.storage.creators == ["ev-studio"]
+        assert scraper.db_storage.creators == ["ev-studio"]
+        assert scraper.stats["creators_scraped"] == 2
+
+    async def test_buffered_creator_is_inserted_once_per_username(self, monkeypatch):
+        """Test that a creator buffered twice is sent to the bulk upsert only once."""
+        monkeypatch.setattr(settings, "checkpoint_enabled", False)
+        scraper = MarketplaceScraper()
+        scraper.storage = _StorageStub()
+        scraper.db_storage = _DatabaseStub()
+        # Same creator, reached through two spellings of the profile URL
+        for index, profile_url in enumerate(
+            ["https://www.framer.com/@ev-studio/", "https://www.framer.com/@ev-studio"], 1
+        ):
+            creator = Creator(username="ev-studio", profile_url=profile_url)
+            product = _product(index)
+            await scraper._save_product(str(product.url), product, creator, False, False)
+
+        await scraper.flush_writes()
+
+        assert scraper.db_storage.creator_batches == [["ev-studio"]]
+
+    async def test_seen_product_url_is_not_fetched_again(self, monkeypatch):
+        """Test that a URL already scraped in this run is skipped before the HTTP request."""
+        monkeypatch.setattr(settings, "checkpoint_enabled", False)
+        scraper = MarketplaceScraper()
+        scraper.product_scraper = _ProductScraperStub()
+        url = "https://www.framer.com/marketplace/templates/product-1/"
+        scraper.seen_product_url_hashes.add(_product_url_key(url))
+
+        assert await scraper.scrape_product(url)
+        assert scraper.product_scraper.calls == 0
+        assert scraper.duplicate_count == 1
+
+    async def test_batched_creators_are_bulk_saved_on_flush(self, monkeypatch):
+        """Test that batch-mode creator DB writes are buffered into one bulk insert."""
+        monkeypatch.setattr(settings, "checkpoint_enabled", False)
+        scraper = MarketplaceScraper()
+        scraper.creator_scraper = _CreatorScraperStub()
+        scraper.storage = _StorageStub()
+        scraper.db_storage = _DatabaseStub()
+
+        assert await scraper.scrape_creator(
+            "https://www.framer.com/@ev-studio/", save_checkpoint_immediately=False
+        )
+        assert scraper.storage.creators == ["ev-studio"]
+        assert scraper.db_storage.creators == []
+        assert scraper.db_storage.creator_batches == []
+
+        await scraper.flush_writes()
+        assert scraper.db_storage.creator_batches == [["ev-studio"]]
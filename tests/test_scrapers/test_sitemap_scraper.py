@@ -1,5 +1,8 @@
 """Tests for SitemapScraper."""
 
+import httpx
+
+from src.config.settings import settings
 from src.scrapers.sitemap_scraper import SitemapScraper
 
 
@@ -77,3 +80,23 @@ class TestSitemapScraper:
         assert len(result["products"]["plugins"]) == 1
         assert len(result["profiles"]) == 1
         assert len(result["categories"]) == 1
+
+    async def test_get_sitemap_revalidates_cache(self, tmp_path, monkeypatch):
+        """Test that an unchanged sitemap is served from cache after a 304."""
+        monkeypatch.setattr(settings, "sitemap_cache_file", str(tmp_path / "sitemap_cache.xml"))
+        monkeypatch.setattr("src.scrapers.sitemap_scraper.random.uniform", lambda a, b: 0.0)
+        conditional_headers = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            conditional_headers.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=b"<urlset></urlset>", headers={"ETag": '"v1"'})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            first = await SitemapScraper(client).get_sitemap()
+            # A new scraper instance reads the validators back from disk
+            second = await SitemapScraper(client).get_sitemap()
+
+        assert first == second == (b"<urlset></urlset>", False, 0.0)
+        assert conditional_headers == [None, '"v1"']
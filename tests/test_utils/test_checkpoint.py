@@ -0,0 +1,71 @@
+"""Tests for CheckpointManager."""
+
+import asyncio
+
+from src.utils.checkpoint import CheckpointManager
+
+
+class TestCheckpointManager:
+    """Tests for CheckpointManager."""
+
+    def test_add_processed_without_save_is_kept_in_memory(self, tmp_path):
+        """Test that deferred processed URLs are remembered and persisted on flush."""
+        manager = CheckpointManager(str(tmp_path / "checkpoint.json"))
+
+        manager.add_processed("https://example.com/a/", save_immediately=False)
+        assert manager.is_processed("https://example.com/a/")
+        assert not (tmp_path / "checkpoint.json").exists()
+
+        manager.flush({"products_scraped": 1})
+        checkpoint = CheckpointManager(str(tmp_path / "checkpoint.json")).load_checkpoint()
+        assert checkpoint["processed_urls"] == {"https://example.com/a/"}
+        assert checkpoint["stats"] == {"products_scraped": 1}
+
+    async def test_flush_async(self, tmp_path):
+        """Test saving the in-memory state from a worker thread."""
+        manager = CheckpointManager(str(tmp_path / "checkpoint.json"))
+        manager.add_processed("https://example.com/a/", save_immediately=False)
+        manager.add_failed("https://example.com/b/")
+        manager.add_processed("https://example.com/c/", save_immediately=False)
+
+        await manager.flush_async()
+
+        checkpoint = manager.load_checkpoint()
+        assert checkpoint["processed_urls"] == {"https://example.com/a/", "https://example.com/c/"}
+        assert checkpoint["failed_urls"] == {"https://example.com/b/"}
+
+    async def test_older_snapshot_does_not_overwrite_newer_save(self, tmp_path):
+        """Test that a background save of an older snapshot never replaces a newer one."""
+        manager = CheckpointManager(str(tmp_path / "checkpoint.json"))
+        manager.add_processed("https://example.com/a/", save_immediately=False)
+
+        # Snapshot taken first, but written from a worker thread while the loop moves on
+        pending_save = asyncio.create_task(manager.flush_async())
+        await asyncio.sleep(0)
+        manager.add_processed("https://example.com/b/")
+        await pending_save
+
+        checkpoint = manager.load_checkpoint()
+        assert checkpoint["processed_urls"] == {"https://example.com/a/", "https://example.com/b/"}
+        assert not (tmp_path / "checkpoint.tmp").exists()
+
+    def test_filter_unprocessed_keeps_order(self, tmp_path):
+        """Test that processed URLs are dropped and the remaining order is preserved."""
+        manager = CheckpointManager(str(tmp_path / "checkpoint.json"))
+        manager.add_processed("https://example.com/b/", save_immediately=False)
+
+        urls = ["https://example.com/c/", "https://example.com/b/", "https://example.com/a/"]
+        assert manager.filter_unprocessed(urls) == [
+            "https://example.com/c/",
+            "https://example.com/a/",
+        ]
+
+    def test_add_failed_without_save_is_kept_in_memory(self, tmp_path):
+        """Test that deferred failed URLs are only written on flush."""
+        manager = CheckpointManager(str(tmp_path / "checkpoint.json"))
+
+        manager.add_failed("https://example.com/a/", save_immediately=False)
+        assert not (tmp_path / "checkpoint.json").exists()
+
+        manager.flush()
+        assert manager.load_checkpoint()["failed_urls"] == {"https://example.com/a/"}
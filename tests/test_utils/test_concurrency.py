@@ -0,0 +1,57 @@
+"""Tests for AdmissionController."""
+
+import asyncio
+
+from src.utils.concurrency import AdmissionController
+
+
+class TestAdmissionController:
+    """Tests for AdmissionController."""
+
+    def test_slow_responses_halve_the_limit(self):
+        """Test that a p95 latency above the target halves the limit."""
+        controller = AdmissionController(max_limit=16, target_latency=1.0)
+
+        for _ in range(20):
+            controller.record(2.0, True)
+
+        assert controller.limit == 8
+
+    def test_failures_shrink_the_limit_down_to_the_minimum(self):
+        """Test that a high failure rate keeps shrinking the limit to min_limit."""
+        controller = AdmissionController(max_limit=4, target_latency=1.0, min_limit=1)
+
+        for _ in range(100):
+            controller.record(0.1, False)
+
+        assert controller.limit == 1
+
+    def test_fast_healthy_responses_grow_the_limit_up_to_the_maximum(self):
+        """Test that the limit recovers by one step per window, capped at max_limit."""
+        controller = AdmissionController(max_limit=4, target_latency=1.0)
+        controller.limit = 2
+
+        for _ in range(100):
+            controller.record(0.1, True)
+
+        assert controller.limit == 4
+
+    async def test_run_caps_in_flight_calls(self):
+        """Test that no more than `limit` calls run at once."""
+        controller = AdmissionController(max_limit=2, target_latency=1.0)
+        running = 0
+        peak = 0
+
+        async def scrape(index):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return True
+
+        results = await asyncio.gather(*(controller.run(scrape, i) for i in range(6)))
+
+        assert results == [True] * 6
+        assert peak == 2
+        assert controller.active == 0
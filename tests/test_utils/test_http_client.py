@@ -0,0 +1,46 @@
+"""Tests for the shared HTTP client."""
+
+import httpx
+
+from src.scrapers.marketplace_scraper import MarketplaceScraper
+from src.utils.http_client import close_shared_client, create_client, get_shared_client
+
+
+class TestSharedClient:
+    """Tests for get_shared_client / close_shared_client."""
+
+    async def test_shared_client_is_reused_until_closed(self):
+        """Test that the shared client is memoized and recreated after closing."""
+        client = get_shared_client()
+        assert get_shared_client() is client
+
+        await close_shared_client()
+        assert client.is_closed
+        assert get_shared_client() is not client
+        await close_shared_client()
+
+    async def test_scraper_leaves_shared_client_open(self):
+        """Test that a scraper using the shared client does not close it on exit."""
+        async with MarketplaceScraper(owns_client=False) as scraper:
+            assert scraper.client is get_shared_client()
+
+        assert not get_shared_client().is_closed
+        await close_shared_client()
+
+
+class TestCreateClient:
+    """Tests for create_client."""
+
+    async def test_environment_proxy_is_used(self, monkeypatch):
+        """Test that HTTPS_PROXY from the environment routes marketplace requests."""
+        for name in ("ALL_PROXY", "all_proxy", "NO_PROXY", "no_proxy", "https_proxy"):
+            monkeypatch.delenv(name, raising=False)
+        monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:8080")
+
+        client = create_client()
+        try:
+            transport = client._transport_for_url(httpx.URL("https://www.framer.com/"))
+            assert transport is not client._transport
+            assert type(transport._pool).__name__ == "AsyncHTTPProxy"
+        finally:
+            await client.aclose()